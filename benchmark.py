@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for builder.py
+Generates a seeded synthetic papers database with the production schema and
+times each build stage separately, so revisions can be compared without
+access to the real cache.db.
+"""
+
+import sqlite3
+import json
+import os
+import sys
+import time
+import random
+import platform
+import resource
+import subprocess
+import tempfile
+import argparse
+import logging
+from datetime import date, timedelta, datetime
+from typing import List, Dict, Any, Optional, Callable, Iterator
+
+import builder
+
+logger = logging.getLogger('benchmark')
+
+# Bumped whenever generated data changes, so cached databases are not reused
+GENERATOR_VERSION = 1
+
+DEFAULT_WORK_DIR = os.path.join(tempfile.gettempdir(), 'researchfeed-benchmark')
+INSERT_BATCH_SIZE = 5000
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+COLUMN_TYPES = {
+    'rlhf_score': 'REAL', 'weak_supervision_score': 'REAL', 'diffusion_reasoning_score': 'REAL',
+    'distributed_training_score': 'REAL', 'datasets_score': 'REAL', 'average_h_index': 'REAL',
+    'total_authors': 'INTEGER', 'authors_found': 'INTEGER', 'highest_h_index': 'INTEGER',
+    'notable_authors_count': 'INTEGER'
+}
+
+TOPICS = ['rlhf', 'weak_supervision', 'diffusion_reasoning', 'distributed_training', 'datasets']
+
+# (value, weight) pairs roughly matching the production archive
+INTRO_STATUSES = [('intro_successful', 93), ('extraction_failed', 6), ('no_intro_found', 1)]
+RELEVANCE_VALUES = [
+    ('not_validated', 750), ('Not Relevant', 207), ('Tangentially Relevant', 31),
+    ('Moderately Relevant', 7), ('Highly Relevant', 5)
+]
+LLM_SCORE_STATUSES = [('not_relevant_enough', 85), ('completed', 15)]
+NOVELTY_SCORES = [('High', 40), ('Moderate', 55), ('Low', 5)]
+IMPACT_SCORES = [('High', 30), ('Moderate', 65), ('Low', 5)]
+RECOMMENDATION_SCORES = [('Should Read', 95), ('Must Read', 3), ('Can Skip', 2)]
+H_INDEX_STATUSES = [('not_fetched', 85), ('completed', 14), ('failed', 1)]
+CATEGORIES = [
+    'cs.AI (Artificial Intelligence)', 'cs.CL (Computation and Language)',
+    'cs.CV (Computer Vision and Pattern Recognition)', 'cs.LG (Machine Learning)',
+    'cs.RO (Robotics)', 'cs.DC (Distributed, Parallel, and Cluster Computing)',
+    'stat.ML (Machine Learning)', 'cs.IR (Information Retrieval)'
+]
+
+WORDS = (
+    'model learning data training network neural language large performance method approach results '
+    'task tasks framework propose proposed show using based state art benchmark evaluation dataset '
+    'datasets reasoning reinforcement feedback human preference alignment diffusion generation image '
+    'video vision transformer attention graph optimization distributed parallel efficient scalable '
+    'robust supervision weak labels noisy agent agents policy reward retrieval augmented inference '
+    'latency memory compute gradient convergence theoretical empirical analysis novel existing prior '
+    'significantly improves outperforms baseline baselines across multiple domains real world'
+).split()
+FIRST_NAMES = (
+    'Wei Li Ana Maria John Yuki Omar Chen Sara David Priya Lucas Elena Ahmed Mei Jonas Fatima '
+    'Carlos Hana Ivan Zoe Ravi Nina Tomás Søren José Zoë'
+).split()
+LAST_NAMES = (
+    'Wang Zhang Smith García Müller Kim Nguyen Patel Rossi Ivanov Chen Silva Kowalski Tanaka '
+    'Johnson Novák Ørsted Dubois Haddad Liu'
+).split()
+LATEX_SNIPPETS = [
+    r'$O(n \log n)$', r'$\mathcal{L}_{\text{KL}}$', r'$\epsilon$-greedy', r'$$\sum_{i=1}^{N} w_i x_i$$',
+    r'\(\alpha = 0.5\)', r'$\mathbb{E}[R_t]$', r'\[ \nabla_\theta J(\theta) \]', r'$k$-NN',
+    r'$\ell_2$', r'\begin{equation} f(x) = \sigma(Wx + b) \end{equation}'
+]
+
+
+def weighted_choice(rnd: random.Random, choices: List[tuple]) -> Any:
+    """Pick a value from (value, weight) pairs."""
+    values, weights = zip(*choices)
+    return rnd.choices(values, weights)[0]
+
+
+def make_text(rnd: random.Random, words: int, math_ratio: float = 0.0) -> str:
+    """Random sentence-like text, optionally with inline/display LaTeX."""
+    tokens = rnd.choices(WORDS, k=words)
+    if math_ratio and rnd.random() < math_ratio:
+        for _ in range(rnd.randint(1, 3)):
+            tokens.insert(rnd.randrange(len(tokens)), rnd.choice(LATEX_SNIPPETS))
+    text = ' '.join(tokens)
+    return text[0].upper() + text[1:] + '.'
+
+
+def make_weekdays(count: int, start: date = date(2025, 1, 6)) -> List[date]:
+    """The first `count` weekdays from start (arXiv only publishes on weekdays)."""
+    days = []
+    day = start
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def generate_paper(rnd: random.Random, index: int, published: date, math_ratio: float) -> Dict[str, Any]:
+    """One papers row with realistic field distributions."""
+    paper_id = f"{2501 + index // 100000}.{index % 100000:05d}"
+    authors = [f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}" for _ in range(rnd.choice([1, 2, 3, 4, 5, 6, 8, 12]))]
+
+    paper = {
+        'id': paper_id,
+        'title': make_text(rnd, rnd.randint(6, 14), math_ratio / 4),
+        'authors': json.dumps(authors, ensure_ascii=False),
+        'categories': json.dumps(rnd.sample(CATEGORIES, rnd.randint(1, 3))),
+        'abstract': make_text(rnd, rnd.randint(120, 250), math_ratio),
+        'published_date': f"{published.isoformat()}T{rnd.randrange(24):02d}:{rnd.randrange(60):02d}:{rnd.randrange(60):02d}Z",
+        'arxiv_url': f"http://arxiv.org/abs/{paper_id}v1",
+        'pdf_url': f"http://arxiv.org/pdf/{paper_id}v1",
+        'scraper_status': 'successfully_scraped',
+        'intro_status': weighted_choice(rnd, INTRO_STATUSES),
+        'embedding_status': 'completed',
+        'llm_validation_status': 'completed',
+        'semantic_scholar_url': None,
+    }
+
+    for topic in TOPICS:
+        relevance = weighted_choice(rnd, RELEVANCE_VALUES)
+        paper[f'{topic}_score'] = round(rnd.uniform(0.1, 0.7), 3)
+        paper[f'{topic}_relevance'] = relevance
+        paper[f'{topic}_justification'] = (
+            'below_threshold' if relevance == 'not_validated' else make_text(rnd, rnd.randint(30, 60))
+        )
+
+    llm_score_status = weighted_choice(rnd, LLM_SCORE_STATUSES)
+    paper['llm_score_status'] = llm_score_status
+    scored = llm_score_status == 'completed'
+    paper['summary'] = make_text(rnd, rnd.randint(70, 120), math_ratio / 2) if scored else None
+    paper['novelty_score'] = weighted_choice(rnd, NOVELTY_SCORES) if scored else None
+    paper['novelty_justification'] = make_text(rnd, rnd.randint(30, 50)) if scored else None
+    paper['impact_score'] = weighted_choice(rnd, IMPACT_SCORES) if scored else None
+    paper['impact_justification'] = make_text(rnd, rnd.randint(30, 50)) if scored else None
+    paper['recommendation_score'] = weighted_choice(rnd, RECOMMENDATION_SCORES) if scored else None
+    paper['recommendation_justification'] = make_text(rnd, rnd.randint(30, 50)) if scored else None
+
+    h_index_status = weighted_choice(rnd, H_INDEX_STATUSES) if scored else 'not_fetched'
+    paper['h_index_status'] = h_index_status
+    author_h_indexes = []
+    if h_index_status == 'completed':
+        for name in authors:
+            found = rnd.random() < 0.7
+            author_h_indexes.append({
+                'name': name,
+                'h_index': int(rnd.paretovariate(1.5)) - 1 if found else None,
+                'profile_url': f"https://www.semanticscholar.org/author/{rnd.randrange(10**9, 10**10)}" if found else None
+            })
+    h_indexes = [author['h_index'] for author in author_h_indexes if author['h_index'] is not None]
+    paper['total_authors'] = len(authors) if author_h_indexes else 0
+    paper['authors_found'] = len(h_indexes)
+    paper['highest_h_index'] = max(h_indexes) if h_indexes else 0
+    paper['average_h_index'] = round(sum(h_indexes) / len(h_indexes), 1) if h_indexes else 0.0
+    paper['notable_authors_count'] = sum(1 for h_index in h_indexes if h_index >= 20)
+    paper['author_h_indexes'] = json.dumps(author_h_indexes, ensure_ascii=False)
+
+    return paper
+
+
+def iter_generated_papers(papers: int, dates: int, seed: int, math_ratio: float) -> Iterator[Dict[str, Any]]:
+    """Papers spread over `dates` weekdays, with a few days busier than others."""
+    rnd = random.Random(seed)
+    days = make_weekdays(dates)
+    day_weights = [rnd.uniform(0.5, 1.5) for _ in days]
+    for index, published in enumerate(rnd.choices(days, day_weights, k=papers)):
+        yield generate_paper(rnd, index, published, math_ratio)
+
+
+def create_database(path: str, papers: int, dates: int, seed: int, math_ratio: float):
+    """Write a synthetic papers table with the production schema to path."""
+    if os.path.exists(path):
+        os.remove(path)
+
+    columns = builder.PAPER_COLUMNS
+    column_defs = ', '.join(
+        f"{column} {COLUMN_TYPES.get(column, 'TEXT')}" + (' PRIMARY KEY' if column == 'id' else '')
+        for column in columns
+    )
+    insert = f"INSERT INTO papers ({', '.join(columns)}, created_at, updated_at) VALUES ({', '.join('?' * (len(columns) + 2))})"
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute(f"CREATE TABLE papers ({column_defs}, created_at TEXT, updated_at TEXT)")
+        conn.execute("CREATE TABLE benchmark_meta (key TEXT PRIMARY KEY, value TEXT)")
+
+        batch = []
+        for paper in iter_generated_papers(papers, dates, seed, math_ratio):
+            batch.append([paper[column] for column in columns] + [timestamp, timestamp])
+            if len(batch) >= INSERT_BATCH_SIZE:
+                conn.executemany(insert, batch)
+                batch = []
+        if batch:
+            conn.executemany(insert, batch)
+
+        conn.execute("INSERT INTO benchmark_meta VALUES ('generator_version', ?)", (str(GENERATOR_VERSION),))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_generator_version(path: str) -> Optional[int]:
+    """Generator version a cached database was written with, if any."""
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT value FROM benchmark_meta WHERE key = 'generator_version'").fetchone()
+            return int(row[0]) if row else None
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+
+def get_peak_rss_mb() -> float:
+    """Peak resident set size of this process so far (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def get_git_revision() -> Optional[str]:
+    """Current commit of the builder being measured, if run from a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class StageTimer:
+    """Accumulates wall time, item counts and output bytes for one stage."""
+
+    def __init__(self, unit: str):
+        self.unit = unit
+        self.seconds = 0.0
+        self.calls = 0
+        self.items = 0
+        self.bytes = 0
+
+    def run(self, func: Callable[[], Any], items: int = 1, measure: Callable[[Any], int] = None) -> Any:
+        start = time.perf_counter()
+        result = func()
+        self.seconds += time.perf_counter() - start
+        self.calls += 1
+        self.items += items
+        if measure is not None:
+            self.bytes += measure(result)
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        result = {
+            "seconds": round(self.seconds, 6),
+            "calls": self.calls,
+            "items": self.items,
+            "unit": self.unit,
+            f"{self.unit}_per_second": round(self.items / self.seconds, 1) if self.seconds else None,
+            "peak_rss_mb": get_peak_rss_mb()
+        }
+        if self.bytes:
+            result["bytes"] = self.bytes
+            result["mb_per_second"] = round(self.bytes / self.seconds / (1024 * 1024), 2) if self.seconds else None
+        return result
+
+
+def sample_dates(dates: List[str], count: int) -> List[str]:
+    """Evenly spaced subset of dates, always including the first and last."""
+    if count >= len(dates):
+        return dates
+    if count <= 1:
+        return dates[:1]
+    step = (len(dates) - 1) / (count - 1)
+    return [dates[round(i * step)] for i in range(count)]
+
+
+def run_benchmark(database_path: str, sample_count: int, repeat: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Time each builder stage against database_path. Per-date stages run on
+    sample_count evenly spaced dates; whole-archive queries run `repeat`
+    times. Peak RSS is cumulative, so stages are measured in pipeline order.
+    """
+    builder.DATABASE_PATH = database_path
+    page_template = builder.load_template(os.path.join(REPO_DIR, 'template.html'), builder.PAGE_TEMPLATE_SLOTS)
+    stages = {}
+
+    timer = StageTimer('calls')
+    for _ in range(repeat):
+        dates = timer.run(builder.get_all_dates)
+    stages['get_all_dates'] = timer.summary()
+
+    sampled = sample_dates(dates, sample_count)
+    query_timer = StageTimer('papers')
+    format_timer = StageTimer('papers')
+    batch_format_timer = StageTimer('papers')
+    dumps_timer = StageTimer('papers')
+    page_timer = StageTimer('papers')
+
+    conn = builder.get_db_connection()
+    try:
+        for date_str in sampled:
+            # Time formatting alone on rows fetched outside the timer, before
+            # get_papers_for_date() has formatted this date's papers
+            rows = conn.execute(
+                f"SELECT {', '.join(builder.PAPER_COLUMNS)} FROM papers WHERE DATE(published_date) = ? ORDER BY id ASC",
+                (date_str,)
+            ).fetchall()
+            format_timer.run(lambda: [builder.format_paper_data(row) for row in rows], items=len(rows))
+
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            tuples = cursor.execute(
+                f"SELECT {builder.FORMAT_SELECT_SQL} FROM papers WHERE DATE(published_date) = ? ORDER BY id ASC",
+                (date_str,)
+            ).fetchall()
+            batch_format_timer.run(lambda: builder.format_paper_rows(tuples), items=len(tuples))
+
+            paper_data = query_timer.run(
+                lambda: builder.get_papers_for_date(date_str, conn=conn), items=0
+            )
+            query_timer.items += paper_data['total_papers']
+
+            dumps_timer.run(
+                lambda: builder.safe_json_dumps(paper_data), items=len(rows),
+                measure=lambda result: len(result.encode('utf-8'))
+            )
+            page_timer.run(
+                lambda: builder.generate_static_page(date_str, paper_data, page_template), items=len(rows),
+                measure=lambda result: len(result.encode('utf-8'))
+            )
+    finally:
+        conn.close()
+
+    stages['get_papers_for_date'] = query_timer.summary()
+    stages['format_paper_data'] = format_timer.summary()
+    stages['format_paper_rows'] = batch_format_timer.summary()
+    stages['safe_json_dumps'] = dumps_timer.summary()
+    stages['generate_static_page'] = page_timer.summary()
+
+    timer = StageTimer('calls')
+    for _ in range(repeat):
+        timer.run(builder.get_landing_page_data)
+    stages['get_landing_page_data'] = timer.summary()
+
+    return stages
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]):
+    """Print per-stage time ratios against an earlier results file."""
+    print(f"\nCompared with {baseline.get('revision') or 'baseline'} ({baseline.get('timestamp')}):")
+    for stage, result in current['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous or not previous.get('seconds') or not result['seconds']:
+            continue
+        # Normalise by items so runs with different sample sizes compare fairly
+        before = previous['seconds'] / max(previous['items'], 1)
+        after = result['seconds'] / max(result['items'], 1)
+        print(f"  {stage:<24} {before / after:6.2f}x {'faster' if after <= before else 'slower'}")
+
+
+def main():
+    """Main entry point with command line argument parsing."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark builder.py stages against a synthetic papers database'
+    )
+    parser.add_argument('--papers', type=int, default=1000, help='Number of papers to generate (default: 1000)')
+    parser.add_argument('--dates', type=int, default=10, help='Number of publication dates (default: 10)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the generator (default: 42)')
+    parser.add_argument(
+        '--math-ratio', type=float, default=0.3,
+        help='Fraction of abstracts containing LaTeX (default: 0.3)'
+    )
+    parser.add_argument(
+        '--sample-dates', type=int, default=10,
+        help='Number of dates to run the per-date stages on (default: 10)'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Runs of the whole-archive queries (default: 3)')
+    parser.add_argument(
+        '--work-dir', default=DEFAULT_WORK_DIR,
+        help=f'Directory for generated databases, reused across runs (default: {DEFAULT_WORK_DIR})'
+    )
+    parser.add_argument('--regenerate', action='store_true', help='Regenerate the database even if cached')
+    parser.add_argument(
+        '--no-date-index', action='store_true',
+        help='Benchmark without the DATE(published_date) index'
+    )
+    parser.add_argument('--output', help='Results JSON path (default: benchmark-<revision>.json)')
+    parser.add_argument('--compare', help='Earlier results JSON to compare against')
+
+    args = parser.parse_args()
+    for name in ('papers', 'dates', 'sample_dates', 'repeat'):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name.replace('_', '-')} must be at least 1")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    # Per-date progress logging from the builder would dominate the timings
+    logging.getLogger('builder').setLevel(logging.WARNING)
+
+    os.makedirs(args.work_dir, exist_ok=True)
+    database_path = os.path.join(
+        args.work_dir, f"papers-{args.papers}-{args.dates}-{args.seed}-{args.math_ratio}.db"
+    )
+    if args.regenerate or get_generator_version(database_path) != GENERATOR_VERSION:
+        logger.info(f"Generating {args.papers} papers over {args.dates} dates into {database_path}")
+        start = time.perf_counter()
+        create_database(database_path, args.papers, args.dates, args.seed, args.math_ratio)
+        logger.info(f"Generated database in {time.perf_counter() - start:.1f}s")
+    else:
+        logger.info(f"Reusing {database_path}")
+
+    # Match the index state the builder would run with
+    builder.DATABASE_PATH = database_path
+    if args.no_date_index:
+        conn = sqlite3.connect(database_path)
+        try:
+            conn.execute(f"DROP INDEX IF EXISTS {builder.DATE_INDEX_NAME}")
+        finally:
+            conn.close()
+    else:
+        builder.ensure_date_index(create=True)
+
+    revision = get_git_revision()
+    stages = run_benchmark(database_path, args.sample_dates, args.repeat)
+    results = {
+        "revision": revision,
+        "timestamp": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "config": {
+            "papers": args.papers,
+            "dates": args.dates,
+            "seed": args.seed,
+            "math_ratio": args.math_ratio,
+            "sample_dates": args.sample_dates,
+            "repeat": args.repeat,
+            "date_index": not args.no_date_index,
+            "generator_version": GENERATOR_VERSION
+        },
+        "stages": stages
+    }
+
+    for stage, result in stages.items():
+        rate = result[f"{result['unit']}_per_second"]
+        print(
+            f"{stage:<24} {result['seconds']:10.4f}s  {result['items']:>9} {result['unit']:<6}"
+            f" {rate if rate is not None else '-':>12}/s  peak RSS {result['peak_rss_mb']} MB"
+        )
+
+    output_path = args.output or f"benchmark-{revision or 'results'}.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    logger.info(f"Wrote results to {output_path}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare_results(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
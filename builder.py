@@ -6,12 +6,36 @@ Converts database papers into static HTML pages with embedded JSON data.
 
 import sqlite3
 import json
+import hashlib
+import gzip
 import os
 import re
+import shutil
+import tempfile
+import unicodedata
+import time
+import cProfile
 import argparse
 import logging
+import mimetypes
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, unquote, quote
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Union
+
+try:
+    import brotli  # optional, only needed for .br sidecars
+except ImportError:
+    brotli = None
+
+try:
+    import resource  # optional, peak memory in --profile reports (not on Windows)
+except ImportError:
+    resource = None
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +50,287 @@ DATABASE_PATH = 'cache.db'
 TEMPLATE_PATH = 'template.html'
 LANDING_PAGE_PATH = 'landingpage.html'
 OUTPUT_DIR = 'output'
+DATE_INDEX_NAME = 'idx_papers_published_day'
+# Read-only build connections: memory-mapped I/O, page cache and prepared statement cache sizes
+DB_MMAP_SIZE = 256 * 1024 * 1024
+DB_CACHE_SIZE_KB = 64 * 1024
+DB_STATEMENT_CACHE_SIZE = 256
+MANIFEST_FILENAME = 'build-manifest.json'
+MANIFEST_VERSION = 1
+DEPLOY_MANIFEST_FILENAME = 'deploy-manifest.json'
+DEPLOY_MANIFEST_VERSION = 1
+JSON_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Placeholders each template must contain exactly once, keyed by slot name
+PAGE_TEMPLATE_SLOTS = {
+    'title': 'PLACEHOLDER_TITLE',
+    'mobile_title': 'PLACEHOLDER_MOBILE_TITLE',
+    'desktop_title': 'PLACEHOLDER_DESKTOP_TITLE',
+    'data': '<!--DATA_HERE-->'
+}
+LANDING_TEMPLATE_SLOTS = {
+    'data': '<!--LANDING_DATA_HERE-->'
+}
+
+# --landing-dates: older dates are listed in per-month files under this directory
+ARCHIVE_DIRNAME = 'archive'
+
+# Compact payload: pipeline bookkeeping the page never reads, and
+# categorical fields that are sent as indexes into a per-page lookup table
+COMPACT_DROPPED_FIELDS = {
+    'scraper_status', 'intro_status', 'embedding_status', 'llm_validation_status'
+}
+COMPACT_DICTIONARY_FIELDS = {
+    'published_date', 'rlhf_relevance', 'weak_supervision_relevance',
+    'diffusion_reasoning_relevance', 'distributed_training_relevance', 'datasets_relevance',
+    'llm_score_status', 'novelty_score', 'impact_score', 'recommendation_score', 'h_index_status'
+}
+
+# Split output: text-heavy fields moved out of the page into fetched shards
+DATA_DIRNAME = 'data'
+DEFAULT_DETAIL_SHARD_SIZE = 10
+SPLIT_DETAIL_FIELDS = (
+    'authors', 'abstract', 'summary', 'author_h_indexes',
+    'recommendation_justification', 'novelty_justification', 'impact_justification',
+    'rlhf_justification', 'weak_supervision_justification', 'diffusion_reasoning_justification',
+    'distributed_training_justification', 'datasets_justification'
+)
+
+# Client-side sort keys and filter buckets precomputed at build time.
+# These mirror calculateRecommendationScore(), calculateRelevanceScore() and
+# the passes*Filter() functions in template.html and must be kept in sync.
+RECOMMENDATION_SORT_WEIGHTS = {'Must Read': 40, 'Should Read': 30, 'Can Skip': 20, 'Ignore': 10}
+NOVELTY_SORT_WEIGHTS = {'High': 4, 'Moderate': 3, 'Low': 2, 'None': 1}
+IMPACT_SORT_WEIGHTS = {'High': 4, 'Moderate': 3, 'Low': 2, 'Negligible': 1}
+RELEVANCE_SORT_WEIGHTS = {
+    'Highly Relevant': 4, 'Moderately Relevant': 3, 'Tangentially Relevant': 2, 'Not Relevant': 1
+}
+RELEVANCE_TOPICS = ['rlhf', 'weak_supervision', 'diffusion_reasoning', 'distributed_training', 'datasets']
+FACET_VALUES = {
+    'llm_score_status': ('completed', 'not_relevant_enough'),
+    'recommendation_score': ('Must Read', 'Should Read', 'Can Skip', 'Ignore'),
+    'novelty_score': ('High', 'Moderate', 'Low'),
+    'impact_score': ('High', 'Moderate', 'Low', 'Negligible')
+}
+
+# Precompressed sidecars written next to text outputs for the static host
+COMPRESSIBLE_EXTENSIONS = ('.html', '.js', '.css', '.json')
+SIDECAR_EXTENSIONS = ('.gz', '.br')
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# Cross-date search index: term shards keyed by prefix, split when too large,
+# and long postings lists moved into continuation chunks by doc-id range.
+# search_tokenize() must stay in sync with searchTokenize() in landingpage.html.
+SEARCH_DIRNAME = 'search'
+SEARCH_INDEX_VERSION = 2
+SEARCH_PREFIX_LENGTH = 2
+SEARCH_MAX_SHARD_BYTES = 128 * 1024
+SEARCH_CHUNK_POSTINGS = 4096
+SEARCH_TOP_POSTINGS = 50
+SEARCH_DOCS_PER_SHARD = 1000
+SEARCH_MAX_TOKEN_LENGTH = 32
+SEARCH_REBUILD_DELETED_RATIO = 0.25
+SEARCH_FIELD_WEIGHTS = {'title': 4, 'authors': 3, 'summary': 1, 'abstract': 1}
+SEARCH_STOPWORDS = {
+    'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'for', 'from', 'has', 'have', 'in', 'is',
+    'it', 'its', 'of', 'on', 'or', 'our', 'that', 'the', 'their', 'these', 'this', 'to', 'we',
+    'which', 'with'
+}
+SEARCH_TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+# Cross-date author index, sharded by a hash of the normalised author name.
+# get_author_key()/get_author_shard() must match template.html.
+AUTHORS_DIRNAME = 'authors'
+AUTHOR_INDEX_VERSION = 1
+AUTHOR_SHARD_COUNT = 64
+
+# Text fields the page may run KaTeX over, and the delimiters it renders
+MATH_FIELDS = (
+    'title', 'abstract', 'summary',
+    'recommendation_justification', 'novelty_justification', 'impact_justification',
+    'rlhf_justification', 'weak_supervision_justification', 'diffusion_reasoning_justification',
+    'distributed_training_justification', 'datasets_justification'
+)
+MATH_PATTERN = re.compile(
+    r'\$\$.+?\$\$|\$.+?\$|\\\(.+?\\\)|\\\[.+?\\\]'
+    r'|\\begin\{(equation|align|alignat|gather|CD)\}.*?\\end\{\1\}',
+    re.DOTALL
+)
+
+# --watch: how often to poll for database/template changes, and how long
+# writes must pause before rebuilding (capped so a busy writer still gets pages)
+WATCH_POLL_INTERVAL = 1.0
+WATCH_DEBOUNCE = 2.0
+WATCH_MAX_DELAY = 30.0
+
+# --serve: local render server defaults
+SERVE_HOST = '127.0.0.1'
+SERVE_PORT = 8000
+SERVE_CACHE_MB = 64
+DATE_PAGE_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})\.html$')
+
+# Inline blocks that can be moved out of templates into shared asset files
+ASSETS_DIRNAME = 'assets'
+INLINE_ASSET_PATTERN = re.compile(r'<(script|style)>(.*?)</\1>', re.DOTALL)
+
+# Columns read for every paper, in the order format_paper_data() expects
+PAPER_COLUMNS = [
+    'id', 'title', 'authors', 'categories', 'abstract', 'published_date', 'arxiv_url', 'pdf_url',
+    'scraper_status', 'intro_status', 'embedding_status', 'rlhf_score', 'weak_supervision_score',
+    'diffusion_reasoning_score', 'distributed_training_score', 'datasets_score',
+    'llm_validation_status', 'rlhf_relevance', 'weak_supervision_relevance',
+    'diffusion_reasoning_relevance', 'distributed_training_relevance', 'datasets_relevance',
+    'rlhf_justification', 'weak_supervision_justification', 'diffusion_reasoning_justification',
+    'distributed_training_justification', 'datasets_justification', 'llm_score_status',
+    'summary', 'novelty_score', 'novelty_justification', 'impact_score', 'impact_justification',
+    'recommendation_score', 'recommendation_justification', 'h_index_status', 'semantic_scholar_url',
+    'total_authors', 'authors_found', 'highest_h_index', 'average_h_index', 'notable_authors_count',
+    'author_h_indexes'
+]
+
+# Select list for format_paper_rows(): PAPER_COLUMNS with NULL defaults and
+# date normalisation done by SQLite, plus the raw published_date last for
+# values the SQL fast path leaves to Python (NULL day).
+PAPER_FLOAT_COLUMNS = {
+    'rlhf_score', 'weak_supervision_score', 'diffusion_reasoning_score',
+    'distributed_training_score', 'datasets_score', 'average_h_index'
+}
+PAPER_COUNT_COLUMNS = {'total_authors', 'authors_found', 'highest_h_index', 'notable_authors_count'}
+# Only plain YYYY-MM-DD prefixes whose Python parse is that same date
+PUBLISHED_DAY_SQL = (
+    "CASE WHEN published_date GLOB '[1-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*' "
+    "AND substr(published_date, 12, 2) != '24' THEN substr(published_date, 1, 10) END"
+)
+FORMAT_SELECT_SQL = ', '.join(
+    f"CAST(COALESCE({column}, 0.0) AS REAL)" if column in PAPER_FLOAT_COLUMNS
+    else f"COALESCE({column}, 0)" if column in PAPER_COUNT_COLUMNS
+    else PUBLISHED_DAY_SQL if column == 'published_date'
+    else column
+    for column in PAPER_COLUMNS
+) + ', published_date'
+FORMAT_BATCH_SIZE = 500
+# --fragment-cache: default file, lock wait in seconds, and version to bump whenever
+# format_paper_rows() or encode_paper_fragment() output changes
+FRAGMENT_CACHE_PATH = 'fragment-cache.db'
+FRAGMENT_CACHE_TIMEOUT = 30.0
+FRAGMENT_CACHE_VERSION = 1
+# --memory-limit: first streamed batch, and in-memory size of a paper per character of its row
+STREAM_INITIAL_BATCH_SIZE = 16
+STREAM_BYTES_PER_ROW_CHAR = 3
+
+
+class BuildProfiler:
+    """
+    Wall/CPU time and row/byte counters per build stage, per date, for
+    --profile. Stages with no date (None) are site-wide. Builds without
+    --profile never create one, so instrumented code only pays for a
+    global lookup and a nullcontext.
+    """
+    
+    def __init__(self):
+        self.records = {}  # (date, stage) -> counters
+        self.started = time.perf_counter()
+        self.started_cpu = time.process_time()
+    
+    def get_record(self, stage: str, date: Optional[str] = None) -> Dict[str, Any]:
+        record = self.records.get((date, stage))
+        if record is None:
+            record = self.records[(date, stage)] = {
+                "wall": 0.0, "cpu": 0.0, "calls": 0, "rows": 0, "bytes_serialized": 0, "bytes_written": 0
+            }
+        return record
+    
+    @contextmanager
+    def stage(self, stage: str, date: Optional[str] = None):
+        record = self.get_record(stage, date)
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall'] += time.perf_counter() - wall
+            record['cpu'] += time.process_time() - cpu
+            record['calls'] += 1
+    
+    def export(self) -> List[tuple]:
+        """Hand collected records to the parent process and start afresh."""
+        records = [(date, stage, record) for (date, stage), record in self.records.items()]
+        self.records = {}
+        return records
+    
+    def merge(self, records: List[tuple]):
+        for date, stage, other in records:
+            record = self.get_record(stage, date)
+            for key, value in other.items():
+                record[key] += value
+    
+    def report(self) -> Dict[str, Any]:
+        """Machine-readable summary: totals per stage, per date and peak memory."""
+        stages = {}
+        dates = {}
+        for (date, stage), record in sorted(self.records.items(), key=lambda item: (item[0][0] or '', item[0][1])):
+            rounded = {key: round(value, 6) if isinstance(value, float) else value for key, value in record.items()}
+            if date is not None:
+                dates.setdefault(date, {})[stage] = rounded
+            total = stages.setdefault(stage, {key: 0 for key in record})
+            for key, value in record.items():
+                total[key] += value
+        for total in stages.values():
+            total['wall'] = round(total['wall'], 6)
+            total['cpu'] = round(total['cpu'], 6)
+        
+        peak_memory = None
+        if resource is not None:
+            # ru_maxrss is in KB on Linux; children are finished pool workers
+            peak_memory = {
+                "self_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                "children_kb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+            }
+        
+        return {
+            "generated_at": datetime.now().isoformat(timespec='seconds'),
+            "wall": round(time.perf_counter() - self.started, 6),
+            "cpu": round(time.process_time() - self.started_cpu, 6),
+            "peak_memory": peak_memory,
+            "stages": stages,
+            "dates": dates
+        }
+
+
+# Set by build_static_site (and pool workers) when --profile is on
+_profiler: Optional[BuildProfiler] = None
+
+
+def profile_stage(stage: str, date: Optional[str] = None):
+    """Context manager timing a stage; yields its counters, or None when not profiling."""
+    if _profiler is None:
+        return nullcontext()
+    return _profiler.stage(stage, date)
+
+
+def iter_profiled_chunks(chunks: Iterable[str], stage: str, date: Optional[str] = None) -> Iterable[str]:
+    """Attribute the time spent producing each chunk (and its size) to a stage."""
+    if _profiler is None:
+        return chunks
+    return _iter_profiled_chunks(chunks, _profiler.get_record(stage, date))
+
+
+def _iter_profiled_chunks(chunks: Iterable[str], record: Dict[str, Any]) -> Iterator[str]:
+    iterator = iter(chunks)
+    record['calls'] += 1
+    while True:
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            record['wall'] += time.perf_counter() - wall
+            record['cpu'] += time.process_time() - cpu
+        record['bytes_serialized'] += len(chunk.encode('utf-8'))
+        yield chunk
 
 
 def safe_json_escape(text: Any) -> Any:
@@ -51,6 +356,14 @@ def safe_json_escape(text: Any) -> Any:
     return text
 
 
+def escape_json_for_html(json_str: str) -> str:
+    """Escape sequences in serialized JSON that could break out of a <script> block."""
+    json_str = json_str.replace('</script>', '<\\/script>')
+    json_str = json_str.replace('<!--', '<\\!--')
+    json_str = json_str.replace('-->', '--\\>')
+    return json_str
+
+
 def safe_json_dumps(data: Dict[str, Any]) -> str:
     """
     Safely serialize data to JSON with proper escaping and formatting.
@@ -60,17 +373,181 @@ def safe_json_dumps(data: Dict[str, Any]) -> str:
         json_str = json.dumps(data, ensure_ascii=False, indent=2)
         
         # Additional HTML-safe escaping for script injection prevention
-        json_str = json_str.replace('</script>', '<\\/script>')
-        json_str = json_str.replace('<!--', '<\\!--')
-        json_str = json_str.replace('-->', '--\\>')
-        
-        return json_str
+        return escape_json_for_html(json_str)
         
     except (TypeError, ValueError) as e:
         logger.error(f"JSON serialization failed: {e}")
         raise Exception(f"Failed to serialize data to JSON: {e}")
 
 
+def iter_safe_json_chunks(data: Any, buffer_size: int = JSON_WRITE_BUFFER_SIZE,
+                          minify: bool = False) -> Iterator[str]:
+    """
+    Serialize data exactly like safe_json_dumps(), but yield the result in
+    escaped chunks of roughly buffer_size characters instead of one string.
+    The encoder never splits a string literal across chunks, so escaping
+    each batch of whole chunks matches escaping the full document.
+    With minify, whitespace is dropped instead of indenting.
+    """
+    if minify:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+    try:
+        pending = []
+        pending_size = 0
+        for chunk in encoder.iterencode(data):
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= buffer_size:
+                yield escape_json_for_html(''.join(pending))
+                pending = []
+                pending_size = 0
+        if pending:
+            yield escape_json_for_html(''.join(pending))
+            
+    except (TypeError, ValueError) as e:
+        logger.error(f"JSON serialization failed: {e}")
+        raise Exception(f"Failed to serialize data to JSON: {e}")
+
+
+class PageTemplate:
+    """
+    HTML template parsed once into static segments and named slots.
+    Pages are rendered by emitting segments and slot values in order, so
+    they can be streamed to disk without copying the template per page.
+    """
+    
+    def __init__(self, content: str, slots: Dict[str, str], name: str = 'template',
+                 assets: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.content_hash = hash_text(content)
+        self.assets = assets or {}
+        
+        # Locate each placeholder; missing or repeated ones are template bugs
+        positions = []
+        for slot, placeholder in slots.items():
+            count = content.count(placeholder)
+            if count != 1:
+                raise Exception(
+                    f"{name} must contain placeholder {placeholder} exactly once, found {count}"
+                )
+            positions.append((content.index(placeholder), placeholder, slot))
+        positions.sort()
+        
+        self.segments = []
+        self.slot_order = []
+        offset = 0
+        for start, placeholder, slot in positions:
+            if start < offset:
+                raise Exception(f"{name} has overlapping placeholders at {placeholder}")
+            self.segments.append(content[offset:start])
+            self.slot_order.append(slot)
+            offset = start + len(placeholder)
+        self.segments.append(content[offset:])
+    
+    def iter_render(self, values: Dict[str, Union[str, Iterable[str]]]) -> Iterator[str]:
+        """Yield the page in order; slot values may be strings or chunk iterables."""
+        for segment, slot in zip(self.segments, self.slot_order):
+            yield segment
+            value = values[slot]
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+        yield self.segments[-1]
+    
+    def render(self, values: Dict[str, Union[str, Iterable[str]]]) -> str:
+        """Render the full page into a string."""
+        return ''.join(self.iter_render(values))
+    
+    def write(self, output_file: str, values: Dict[str, Union[str, Iterable[str]]]) -> bool:
+        """Stream the rendered page to a file chunk by chunk; True if the file changed."""
+        return write_output_file(output_file, self.iter_render(values))
+
+
+def extract_inline_assets(content: str, slots: Dict[str, str]) -> (str, Dict[str, str]):
+    """
+    Move inline <script> and <style> blocks out of a template into files
+    named by the hash of their content, so browsers can cache them forever.
+    Blocks containing a placeholder differ per page and stay inline.
+    Returns the rewritten template and a mapping of asset path to content.
+    """
+    assets = {}
+    
+    def replace_block(match):
+        tag, body = match.group(1), match.group(2)
+        if any(placeholder in body for placeholder in slots.values()):
+            return match.group(0)
+        
+        digest = hash_text(body)[:16]
+        if tag == 'script':
+            asset_path = f"{ASSETS_DIRNAME}/script.{digest}.js"
+            replacement = f'<script src="{asset_path}"></script>'
+        else:
+            asset_path = f"{ASSETS_DIRNAME}/style.{digest}.css"
+            replacement = f'<link rel="stylesheet" href="{asset_path}">'
+        assets[asset_path] = body
+        return replacement
+    
+    return INLINE_ASSET_PATTERN.sub(replace_block, content), assets
+
+
+# Compiled templates kept across builds in one process (--watch), keyed by
+# (path, slots, external_assets) and reused while the file is unchanged
+_template_cache: Dict[tuple, tuple] = {}
+
+
+def load_template(path: str, slots: Dict[str, str], external_assets: bool = False) -> PageTemplate:
+    """
+    Read and compile a template, failing early on bad placeholders.
+    With external_assets, inline scripts and styles are split into asset files.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Template file not found: {path}")
+    
+    cache_key = (path, tuple(slots.items()), external_assets)
+    stat = os.stat(path)
+    file_signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _template_cache.get(cache_key)
+    if cached is not None and cached[0] == file_signature:
+        logger.debug(f"Reusing compiled template {path}")
+        return cached[1]
+    
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except Exception as e:
+        raise Exception(f"Failed to read template {path}: {e}")
+    
+    assets = None
+    if external_assets:
+        content, assets = extract_inline_assets(content, slots)
+        logger.info(f"Extracted {len(assets)} inline assets from {path}")
+    
+    template = PageTemplate(content, slots, name=path, assets=assets)
+    _template_cache[cache_key] = (file_signature, template)
+    logger.info(f"Loaded template from {path}")
+    return template
+
+
+def write_template_assets(template: PageTemplate) -> int:
+    """
+    Write a template's extracted assets to the output directory.
+    Asset names contain their content hash, so existing files are left alone.
+    Returns the number of files written.
+    """
+    written = 0
+    for asset_path, body in template.assets.items():
+        output_file = os.path.join(OUTPUT_DIR, asset_path)
+        if os.path.exists(output_file):
+            continue
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        write_output_file(output_file, [body])
+        written += 1
+    return written
+
+
 def get_db_connection() -> sqlite3.Connection:
     """Get database connection with proper error handling."""
     try:
@@ -86,6 +563,121 @@ def get_db_connection() -> sqlite3.Connection:
         raise Exception(f"Cannot connect to database: {e}")
 
 
+def get_readonly_db_connection(immutable: bool = False, memory_limit: Optional[int] = None) -> sqlite3.Connection:
+    """
+    Open a read-only database connection tuned for builds: memory-mapped
+    reads, a larger page cache, query_only, and a statement cache so the
+    per-date queries are prepared once per connection.
+    With immutable, SQLite also skips locking and change detection; only
+    use it on a snapshot of the database that nothing writes to.
+    With memory_limit, mmap and the larger page cache are left off, since
+    both count towards the process's resident memory.
+    """
+    try:
+        if not os.path.exists(DATABASE_PATH):
+            raise FileNotFoundError(f"Database file not found: {DATABASE_PATH}")
+        
+        uri = f"file:{quote(os.path.abspath(DATABASE_PATH))}?mode=ro"
+        if immutable:
+            uri += "&immutable=1"
+        conn = sqlite3.connect(uri, uri=True, cached_statements=DB_STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        if memory_limit is None:
+            conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+            conn.execute(f"PRAGMA cache_size = -{DB_CACHE_SIZE_KB}")
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+        
+    except sqlite3.Error as e:
+        logger.error(f"Database connection failed: {e}")
+        raise Exception(f"Cannot connect to database: {e}")
+
+
+# Read-only connection shared by every query of a build, set by shared_db_connection
+_shared_conn = None
+
+
+@contextmanager
+def shared_db_connection(immutable: bool = False, memory_limit: Optional[int] = None,
+                         conn: Optional[sqlite3.Connection] = None) -> Iterator[sqlite3.Connection]:
+    """
+    Serve every read inside the block from one tuned read-only connection,
+    so connection setup and page cache are paid once per build, not per date.
+    With conn, that already open connection is shared and left open.
+    """
+    global _shared_conn
+    previous = _shared_conn
+    _shared_conn = conn if conn is not None else get_readonly_db_connection(immutable, memory_limit)
+    try:
+        yield _shared_conn
+    finally:
+        if conn is None:
+            _shared_conn.close()
+        _shared_conn = previous
+
+
+def acquire_db_connection(conn: Optional[sqlite3.Connection] = None) -> (sqlite3.Connection, bool):
+    """
+    Pick the connection for a read: the one passed in, the shared build
+    connection, or a new one. Returns (connection, owned); the caller
+    closes owned connections.
+    """
+    if conn is not None:
+        return conn, False
+    if _shared_conn is not None:
+        return _shared_conn, False
+    return get_db_connection(), True
+
+
+def date_queries_use_index(conn: sqlite3.Connection) -> bool:
+    """Check via EXPLAIN QUERY PLAN whether per-date lookups hit an index."""
+    cursor = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT id FROM papers WHERE DATE(published_date) = ? ORDER BY id ASC",
+        ('1970-01-01',)
+    )
+    plan = [row['detail'] for row in cursor.fetchall()]
+    logger.debug(f"Per-date query plan: {plan}")
+    return any(detail.startswith('SEARCH') and 'INDEX' in detail for detail in plan)
+
+
+def ensure_date_index(create: bool = False) -> bool:
+    """
+    Make sure per-date queries can use an index on DATE(published_date).
+    Every date query filters on that expression, so without a matching
+    expression index each one is a full scan of papers.
+    Returns True if the index is in place after the call.
+    """
+    conn = get_db_connection()
+    try:
+        if date_queries_use_index(conn):
+            logger.info("Date queries use an index on DATE(published_date)")
+            return True
+        
+        if not create:
+            logger.warning(
+                "No index on DATE(published_date); every date query will scan the "
+                "papers table. Run with --create-index to add one."
+            )
+            return False
+        
+        logger.info(f"Creating index {DATE_INDEX_NAME} on papers(DATE(published_date), id)")
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {DATE_INDEX_NAME} ON papers (DATE(published_date), id)"
+        )
+        conn.commit()
+        
+        if not date_queries_use_index(conn):
+            logger.warning(f"Index {DATE_INDEX_NAME} created but not used by date queries")
+            return False
+        return True
+        
+    except sqlite3.Error as e:
+        logger.error(f"Date index check failed: {e}")
+        raise Exception(f"Failed to check date index: {e}")
+    finally:
+        conn.close()
+
+
 def parse_json_field(field_value: str) -> List[Any]:
     """Safely parse JSON fields from database."""
     if not field_value:
@@ -98,6 +690,38 @@ def parse_json_field(field_value: str) -> List[Any]:
         return []
 
 
+def contains_math(text: Any) -> bool:
+    """Whether KaTeX auto-render would find a delimited expression in text."""
+    if not isinstance(text, str) or ('$' not in text and '\\' not in text):
+        return False
+    return MATH_PATTERN.search(text) is not None
+
+
+def get_math_fields(paper: Dict[str, Any]) -> List[str]:
+    """Names of the text fields the page needs to run KaTeX on."""
+    fields = []
+    for field in MATH_FIELDS:
+        text = paper.get(field)
+        # Cheap delimiter check first; most fields have no math at all
+        if isinstance(text, str) and ('$' in text or '\\' in text) and contains_math(text):
+            fields.append(field)
+    return fields
+
+
+def normalize_published_date(published_date: Any) -> Any:
+    """Reduce an ISO datetime to YYYY-MM-DD, leaving unparseable values as they are."""
+    if published_date:
+        try:
+            # Parse ISO format and extract date
+            dt = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
+            published_date = dt.strftime('%Y-%m-%d')
+        except (ValueError, AttributeError):
+            # If parsing fails, try to extract YYYY-MM-DD pattern
+            match = re.search(r'(\d{4}-\d{2}-\d{2})', published_date)
+            published_date = match.group(1) if match else published_date
+    return published_date
+
+
 def format_paper_data(row: sqlite3.Row) -> Dict[str, Any]:
     """
     Format a database row into the required JSON structure with safe escaping.
@@ -139,16 +763,7 @@ def format_paper_data(row: sqlite3.Row) -> Dict[str, Any]:
                 escaped_author_h_indexes.append(escaped_author_info)
         
         # Format date (extract date part from ISO datetime)
-        published_date = row['published_date']
-        if published_date:
-            try:
-                # Parse ISO format and extract date
-                dt = datetime.fromisoformat(published_date.replace('Z', '+00:00'))
-                published_date = dt.strftime('%Y-%m-%d')
-            except (ValueError, AttributeError):
-                # If parsing fails, try to extract YYYY-MM-DD pattern
-                match = re.search(r'(\d{4}-\d{2}-\d{2})', published_date)
-                published_date = match.group(1) if match else published_date
+        published_date = normalize_published_date(row['published_date'])
         
         # Build complete paper data structure
         paper_data = {
@@ -196,6 +811,7 @@ def format_paper_data(row: sqlite3.Row) -> Dict[str, Any]:
             "notable_authors_count": row['notable_authors_count'] if row['notable_authors_count'] is not None else 0,
             "author_h_indexes": escaped_author_h_indexes
         }
+        paper_data["math_fields"] = get_math_fields(paper_data)
         
         return paper_data
         
@@ -204,15 +820,57 @@ def format_paper_data(row: sqlite3.Row) -> Dict[str, Any]:
         raise Exception(f"Failed to format paper data: {e}")
 
 
+def format_paper_rows(rows: Iterable[tuple]) -> List[Dict[str, Any]]:
+    """
+    Batch equivalent of format_paper_data() for plain tuples selected with
+    FORMAT_SELECT_SQL. The output is identical, but each paper dict is
+    built straight from the row by position, and the work that
+    format_paper_data() does per field in Python happens in SQL instead.
+    safe_json_escape() is a no-op, so it is not called per field.
+    """
+    papers = []
+    parsed_categories = {}  # Few distinct category lists per date
+    for row in rows:
+        try:
+            paper = dict(zip(PAPER_COLUMNS, row))
+            paper['authors'] = list(parse_json_field(paper['authors']))
+            
+            categories = parsed_categories.get(paper['categories'])
+            if categories is None:
+                categories = parsed_categories[paper['categories']] = list(parse_json_field(paper['categories']))
+            paper['categories'] = list(categories)
+            
+            author_h_indexes = paper['author_h_indexes']
+            paper['author_h_indexes'] = [
+                {
+                    'name': author_info.get('name', ''),
+                    'h_index': author_info.get('h_index', 0),
+                    'profile_url': author_info.get('profile_url', '')
+                }
+                for author_info in parse_json_field(author_h_indexes)
+                if isinstance(author_info, dict)
+            ] if author_h_indexes != '[]' else []
+            if paper['published_date'] is None:
+                paper['published_date'] = normalize_published_date(row[-1])
+            paper['math_fields'] = get_math_fields(paper)
+            papers.append(paper)
+            
+        except Exception as e:
+            logger.error(f"Error formatting paper {row[0]}: {e}")
+            raise Exception(f"Failed to format paper data: {e}")
+    
+    return papers
+
+
 def get_all_dates() -> List[str]:
     """Get all unique dates that have papers in the database."""
-    conn = get_db_connection()
+    conn, owns_connection = acquire_db_connection()
     try:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT DISTINCT DATE(published_date) as date 
             FROM papers 
-            WHERE published_date IS NOT NULL 
+            WHERE DATE(published_date) IS NOT NULL 
             ORDER BY date DESC
         """)
         
@@ -224,21 +882,93 @@ def get_all_dates() -> List[str]:
         logger.error(f"Database query failed: {e}")
         raise Exception(f"Failed to query dates: {e}")
     finally:
-        conn.close()
+        if owns_connection:
+            conn.close()
 
 
-def get_papers_for_date(date: str, max_papers: Optional[int] = None) -> Dict[str, Any]:
-    """Get all papers for a specific date."""
-    conn = get_db_connection()
+def iter_paper_rows(date: str, max_papers: Optional[int] = None,
+                    conn: Optional[sqlite3.Connection] = None,
+                    memory_limit: Optional[int] = None) -> Iterator[List[tuple]]:
+    """
+    Yield a date's FORMAT_SELECT_SQL rows in id order, one fetchmany batch at a time.
+    With memory_limit (bytes), batches are sized from the largest row seen so
+    far so that the rows and dicts in flight stay under the limit.
+    """
+    conn, owns_connection = acquire_db_connection(conn)
+    try:
+        # Build query with optional limit
+        query = f"""
+        SELECT {FORMAT_SELECT_SQL}
+        FROM papers 
+        WHERE DATE(published_date) = ?
+        ORDER BY id ASC
+        """
+        
+        if max_papers:
+            query += f" LIMIT {max_papers}"
+            logger.info(f"Limiting to {max_papers} papers for {date}")
+        
+        # Fetch plain tuples a batch at a time
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        with profile_stage('query', date):
+            cursor.execute(query, (date,))
+        
+        batch_size = FORMAT_BATCH_SIZE if memory_limit is None else STREAM_INITIAL_BATCH_SIZE
+        largest_row = 0
+        while True:
+            with profile_stage('query', date) as record:
+                rows = cursor.fetchmany(batch_size)
+                if record is not None:
+                    record['rows'] += len(rows)
+            if not rows:
+                break
+            
+            if memory_limit is not None:
+                largest_row = max(largest_row, *(
+                    sum(len(value) for value in row if isinstance(value, str)) for row in rows
+                ))
+                batch_size = max(1, min(FORMAT_BATCH_SIZE, memory_limit // (largest_row * STREAM_BYTES_PER_ROW_CHAR + 1)))
+            yield rows
+        
+    except sqlite3.Error as e:
+        logger.error(f"Database query failed for {date}: {e}")
+        raise Exception(f"Failed to query papers for {date}: {e}")
+    finally:
+        if owns_connection:
+            conn.close()
+
+
+def iter_papers_for_date(date: str, max_papers: Optional[int] = None,
+                         conn: Optional[sqlite3.Connection] = None,
+                         memory_limit: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+    """Yield a date's formatted papers in id order, one batch of rows at a time."""
+    for rows in iter_paper_rows(date, max_papers, conn, memory_limit):
+        with profile_stage('format', date) as record:
+            papers = format_paper_rows(rows)
+            if record is not None:
+                record['rows'] += len(rows)
+        rows = None
+        yield papers
+
+
+def get_papers_for_date(date: str, max_papers: Optional[int] = None,
+                        conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
+    """
+    Get all papers for a specific date.
+    Uses the given or shared connection if there is one, otherwise opens (and closes) one.
+    """
+    conn, owns_connection = acquire_db_connection(conn)
     try:
         cursor = conn.cursor()
         
         # Get total count first
-        cursor.execute(
-            "SELECT COUNT(*) as total FROM papers WHERE DATE(published_date) = ?",
-            (date,)
-        )
-        total_papers = cursor.fetchone()['total']
+        with profile_stage('query', date):
+            cursor.execute(
+                "SELECT COUNT(*) as total FROM papers WHERE DATE(published_date) = ?",
+                (date,)
+            )
+            total_papers = cursor.fetchone()['total']
         
         if total_papers == 0:
             logger.warning(f"No papers found for date {date}")
@@ -248,36 +978,9 @@ def get_papers_for_date(date: str, max_papers: Optional[int] = None) -> Dict[str
                 "date": date
             }
         
-        # Build query with optional limit
-        query = """
-        SELECT id, title, authors, categories, abstract, published_date, arxiv_url, pdf_url,
-               scraper_status, intro_status, embedding_status, rlhf_score, weak_supervision_score,
-               diffusion_reasoning_score, distributed_training_score, datasets_score,
-               llm_validation_status, rlhf_relevance, weak_supervision_relevance,
-               diffusion_reasoning_relevance, distributed_training_relevance, datasets_relevance,
-               rlhf_justification, weak_supervision_justification, diffusion_reasoning_justification,
-               distributed_training_justification, datasets_justification, llm_score_status,
-               summary, novelty_score, novelty_justification, impact_score, impact_justification,
-               recommendation_score, recommendation_justification, h_index_status, semantic_scholar_url,
-               total_authors, authors_found, highest_h_index, average_h_index, notable_authors_count,
-               author_h_indexes
-        FROM papers 
-        WHERE DATE(published_date) = ?
-        ORDER BY id ASC
-        """
-        
-        if max_papers:
-            query += f" LIMIT {max_papers}"
-            logger.info(f"Limiting to {max_papers} papers for {date}")
-        
-        cursor.execute(query, (date,))
-        rows = cursor.fetchall()
-        
-        # Format papers data
         papers = []
-        for row in rows:
-            paper_data = format_paper_data(row)
-            papers.append(paper_data)
+        for batch in iter_papers_for_date(date, max_papers, conn):
+            papers.extend(batch)
         
         result = {
             "papers": papers,
@@ -292,99 +995,322 @@ def get_papers_for_date(date: str, max_papers: Optional[int] = None) -> Dict[str
         logger.error(f"Database query failed for {date}: {e}")
         raise Exception(f"Failed to query papers for {date}: {e}")
     finally:
-        conn.close()
+        if owns_connection:
+            conn.close()
 
 
-def format_date_for_title(date_str: str) -> str:
-    """Format YYYY-MM-DD date into human readable format."""
+def get_date_markers(target_date: Optional[str] = None,
+                     conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, List[Any]]]:
+    """
+    Get a cheap change marker per date: [row count, latest updated_at], read
+    with one grouped query over the date index. Returns None when papers has
+    no updated_at column, in which case only a content hash can detect edits.
+    Writers must bump updated_at on every edit; an edit that keeps both the
+    count and the latest updated_at of its date is only picked up by --force.
+    """
+    conn, owns_connection = acquire_db_connection(conn)
     try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        return date_obj.strftime('%d %B %Y')  # "15 July 2025"
-    except ValueError:
-        logger.warning(f"Invalid date format: {date_str}")
-        return date_str
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(papers)")}
+        if 'updated_at' not in columns:
+            return None
+        cursor = conn.execute(f"""
+            SELECT DATE(published_date) as date, COUNT(*) as total, MAX(updated_at) as updated
+            FROM papers 
+            WHERE DATE(published_date) {'= ?' if target_date else 'IS NOT NULL'}
+            GROUP BY date
+        """, (target_date,) if target_date else ())
+        return {row['date']: [row['total'], row['updated']] for row in cursor}
+        
+    except sqlite3.Error as e:
+        logger.error(f"Database query failed: {e}")
+        raise Exception(f"Failed to read date markers: {e}")
+    finally:
+        if owns_connection:
+            conn.close()
 
 
-def get_day_name(date_str: str) -> str:
-    """Get day name from YYYY-MM-DD date string."""
-    try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        return date_obj.strftime('%A')  # "Friday"
-    except ValueError:
-        logger.warning(f"Invalid date format: {date_str}")
-        return ""
+def hash_date_rows(cursor: sqlite3.Cursor, fingerprints: Dict[str, Dict[str, Any]]):
+    """Hash rows of (date, *PAPER_COLUMNS) ordered by date and id into fingerprints."""
+    current_date = None
+    hasher = None
+    count = 0
+    for row in cursor:
+        if row['date'] != current_date:
+            if current_date is not None:
+                fingerprints[current_date] = {"rows": count, "content": hasher.hexdigest()}
+            current_date = row['date']
+            hasher = hashlib.sha256()
+            count = 0
+        hasher.update(repr(tuple(row)[1:]).encode('utf-8', 'backslashreplace'))
+        count += 1
+    if current_date is not None:
+        fingerprints[current_date] = {"rows": count, "content": hasher.hexdigest()}
 
 
-def get_landing_page_data() -> List[Dict[str, Any]]:
+def get_date_fingerprints(target_date: Optional[str] = None, conn: Optional[sqlite3.Connection] = None,
+                          cache: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
     """
-    Get data for all dates to populate the landing page.
-    Returns list of date objects with stats and URL.
+    Compute a content fingerprint for each date: row count plus a hash of the
+    raw column values of every paper. Rows are streamed and hashed without
+    being formatted, so this is much cheaper than rebuilding a page.
+    With cache (date -> {rows, updated, content}, kept in the build manifest),
+    only dates whose get_date_markers() marker changed are hashed again, and
+    the cache is updated in place.
     """
-    conn = get_db_connection()
+    conn, owns_connection = acquire_db_connection(conn)
     try:
-        cursor = conn.cursor()
+        markers = get_date_markers(target_date, conn) if cache is not None else None
+        fingerprints = {}
+        stale_dates = None
+        if markers is not None:
+            stale_dates = []
+            for date, (rows, updated) in markers.items():
+                entry = cache.get(date)
+                if entry and entry['rows'] == rows and entry['updated'] == updated:
+                    fingerprints[date] = {"rows": rows, "content": entry['content']}
+                else:
+                    stale_dates.append(date)
         
-        # Get all dates with papers
-        cursor.execute("""
-            SELECT DISTINCT DATE(published_date) as date 
+        cursor = conn.cursor()
+        query = f"""
+            SELECT DATE(published_date) as date, {', '.join(PAPER_COLUMNS)}
             FROM papers 
-            WHERE published_date IS NOT NULL 
-            ORDER BY date DESC
-        """)
+            WHERE DATE(published_date) {{}}
+            ORDER BY date, id ASC
+        """
+        if stale_dates is None or (stale_dates and len(stale_dates) == len(markers)):
+            # Nothing to reuse: hash everything in one pass
+            cursor.execute(query.format('= ?' if target_date else 'IS NOT NULL'),
+                           (target_date,) if target_date else ())
+            hash_date_rows(cursor, fingerprints)
+        else:
+            for date in stale_dates:
+                cursor.execute(query.format('= ?'), (date,))
+                hash_date_rows(cursor, fingerprints)
         
-        dates = [row['date'] for row in cursor.fetchall()]
-        logger.info(f"Processing {len(dates)} dates for landing page")
+        if markers is not None:
+            if not target_date:
+                for date in list(cache):
+                    if date not in markers:
+                        del cache[date]
+            for date in stale_dates:
+                cache[date] = {"rows": markers[date][0], "updated": markers[date][1],
+                               "content": fingerprints[date]['content']}
+            if stale_dates:
+                logger.info(f"Fingerprinted {len(stale_dates)} changed dates, reused {len(markers) - len(stale_dates)}")
         
-        landing_data = []
+        return fingerprints
         
-        for date in dates:
-            # Get total papers for this date
-            cursor.execute(
-                "SELECT COUNT(*) as total FROM papers WHERE DATE(published_date) = ?",
-                (date,)
-            )
-            total_papers = cursor.fetchone()['total']
-            
-            if total_papers == 0:
-                continue
-            
-            # Get recommendation score counts
-            cursor.execute("""
-                SELECT 
-                    COUNT(CASE WHEN recommendation_score = 'Must Read' THEN 1 END) as must_read,
-                    COUNT(CASE WHEN recommendation_score = 'Should Read' THEN 1 END) as should_read
-                FROM papers 
-                WHERE DATE(published_date) = ?
-            """, (date,))
-            
-            recommendation_counts = cursor.fetchone()
-            
-            # Get relevance counts for each category
-            cursor.execute("""
-                SELECT 
-                    COUNT(CASE WHEN rlhf_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as rlhf,
-                    COUNT(CASE WHEN weak_supervision_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as weak_supervision,
-                    COUNT(CASE WHEN diffusion_reasoning_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as diffusion_reasoning,
-                    COUNT(CASE WHEN distributed_training_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as distributed_training,
-                    COUNT(CASE WHEN datasets_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as datasets
-                FROM papers 
-                WHERE DATE(published_date) = ?
-            """, (date,))
-            
-            relevance_counts = cursor.fetchone()
-            
-            # Format the data
-            date_data = {
-                "date": format_date_for_title(date),
-                "day": get_day_name(date),
+    except sqlite3.Error as e:
+        logger.error(f"Database query failed: {e}")
+        raise Exception(f"Failed to fingerprint dates: {e}")
+    finally:
+        if owns_connection:
+            conn.close()
+
+
+def hash_text(text: str) -> str:
+    """Return the SHA-256 hex digest of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def is_temp_output(filename: str) -> bool:
+    """Whether a filename is a write_output_file temp file."""
+    return filename.startswith('.') and filename.endswith('.tmp')
+
+
+def write_output_file(path: str, chunks: Iterable[Union[str, bytes]]) -> bool:
+    """
+    Write an output file through a temp file and rename, so readers never see
+    a half-written file. If the existing file already has the same bytes it is
+    left alone, keeping its mtime for rsync and the deploy delta.
+    Returns True if the file was created or changed.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                data = chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+                digest.update(data)
+                size += len(data)
+                f.write(data)
+        
+        if os.path.isfile(path) and os.path.getsize(path) == size and hash_file(path) == digest.hexdigest():
+            os.remove(temp_path)
+            return False
+        
+        # mkstemp creates 0600 files; outputs are meant to be served
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+        return True
+        
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def load_build_manifest() -> Dict[str, Any]:
+    """Load the build manifest from the output directory, or an empty one."""
+    manifest_path = os.path.join(OUTPUT_DIR, MANIFEST_FILENAME)
+    empty_manifest = {"version": MANIFEST_VERSION, "pages": {}, "compressed": {}, "outputs": {}, "dates": {}}
+    if not os.path.exists(manifest_path):
+        return empty_manifest
+    
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable build manifest {manifest_path}: {e}")
+        return empty_manifest
+    
+    if manifest.get('version') != MANIFEST_VERSION or not isinstance(manifest.get('pages'), dict):
+        logger.info("Build manifest is from a different version, rebuilding everything")
+        return empty_manifest
+    manifest.setdefault('compressed', {})
+    manifest.setdefault('outputs', {})
+    manifest.setdefault('dates', {})
+    return manifest
+
+
+def save_build_manifest(manifest: Dict[str, Any]):
+    """Write the build manifest to the output directory."""
+    manifest_path = os.path.join(OUTPUT_DIR, MANIFEST_FILENAME)
+    write_output_file(manifest_path, [json.dumps(manifest, indent=2, sort_keys=True)])
+
+
+def update_deploy_manifest(manifest: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Hash every file under OUTPUT_DIR and write DEPLOY_MANIFEST_FILENAME with
+    the files added, changed and removed since the previous build, plus the
+    hash of every current file, so the deploy step can upload only the delta.
+    Hashes recorded in the build manifest are reused while size and mtime match.
+    """
+    previous = manifest['outputs']
+    current = {}
+    for root, _, filenames in os.walk(OUTPUT_DIR):
+        for filename in filenames:
+            if filename in (MANIFEST_FILENAME, DEPLOY_MANIFEST_FILENAME) or is_temp_output(filename):
+                continue
+            path = os.path.join(root, filename)
+            rel_path = os.path.relpath(path, OUTPUT_DIR).replace(os.sep, '/')
+            stat = os.stat(path)
+            entry = previous.get(rel_path)
+            if not entry or entry['size'] != stat.st_size or entry['mtime_ns'] != stat.st_mtime_ns:
+                entry = {"sha256": hash_file(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            current[rel_path] = entry
+    
+    added = {rel_path: entry['sha256'] for rel_path, entry in current.items() if rel_path not in previous}
+    changed = {
+        rel_path: entry['sha256'] for rel_path, entry in current.items()
+        if rel_path in previous and previous[rel_path]['sha256'] != entry['sha256']
+    }
+    removed = sorted(rel_path for rel_path in previous if rel_path not in current)
+    manifest['outputs'] = current
+    
+    write_output_file(os.path.join(OUTPUT_DIR, DEPLOY_MANIFEST_FILENAME), [json.dumps({
+        "version": DEPLOY_MANIFEST_VERSION,
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "files": {rel_path: entry['sha256'] for rel_path, entry in current.items()}
+    }, indent=2, sort_keys=True)])
+    
+    return {
+        "added": len(added),
+        "changed": len(changed),
+        "removed": len(removed),
+        "unchanged": len(current) - len(added) - len(changed)
+    }
+
+
+def is_page_up_to_date(manifest: Dict[str, Any], filename: str, fingerprint: Dict[str, Any]) -> bool:
+    """Check whether an output page exists and was built from the same inputs."""
+    if not os.path.exists(os.path.join(OUTPUT_DIR, filename)):
+        return False
+    return manifest['pages'].get(filename) == fingerprint
+
+
+def format_date_for_title(date_str: str) -> str:
+    """Format YYYY-MM-DD date into human readable format."""
+    try:
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        return date_obj.strftime('%d %B %Y')  # "15 July 2025"
+    except ValueError:
+        logger.warning(f"Invalid date format: {date_str}")
+        return date_str
+
+
+def get_day_name(date_str: str) -> str:
+    """Get day name from YYYY-MM-DD date string."""
+    try:
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        return date_obj.strftime('%A')  # "Friday"
+    except ValueError:
+        logger.warning(f"Invalid date format: {date_str}")
+        return ""
+
+
+def get_landing_page_data(conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
+    """
+    Get data for all dates to populate the landing page.
+    Returns list of date objects with stats and URL.
+    """
+    conn, owns_connection = acquire_db_connection(conn)
+    try:
+        cursor = conn.cursor()
+        
+        # Aggregate totals, recommendation and relevance counts for every date
+        # in a single grouped pass instead of several queries per date
+        cursor.execute("""
+            SELECT 
+                DATE(published_date) as date,
+                COUNT(*) as total,
+                COUNT(CASE WHEN recommendation_score = 'Must Read' THEN 1 END) as must_read,
+                COUNT(CASE WHEN recommendation_score = 'Should Read' THEN 1 END) as should_read,
+                COUNT(CASE WHEN rlhf_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as rlhf,
+                COUNT(CASE WHEN weak_supervision_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as weak_supervision,
+                COUNT(CASE WHEN diffusion_reasoning_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as diffusion_reasoning,
+                COUNT(CASE WHEN distributed_training_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as distributed_training,
+                COUNT(CASE WHEN datasets_relevance IN ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant') THEN 1 END) as datasets
+            FROM papers 
+            WHERE DATE(published_date) IS NOT NULL 
+            GROUP BY date
+            ORDER BY date DESC
+        """)
+        
+        rows = cursor.fetchall()
+        logger.info(f"Processing {len(rows)} dates for landing page")
+        
+        landing_data = []
+        
+        for row in rows:
+            date = row['date']
+            total_papers = row['total']
+            
+            # Format the data
+            date_data = {
+                "date": format_date_for_title(date),
+                "day": get_day_name(date),
                 "stats": {
-                    "Must Read": recommendation_counts['must_read'],
-                    "Should Read": recommendation_counts['should_read'],
-                    "RLHF": relevance_counts['rlhf'],
-                    "Weak Supervision": relevance_counts['weak_supervision'],
-                    "Diffusion Reasoning": relevance_counts['diffusion_reasoning'],
-                    "Distributed Training": relevance_counts['distributed_training'],
-                    "Datasets": relevance_counts['datasets']
+                    "Must Read": row['must_read'],
+                    "Should Read": row['should_read'],
+                    "RLHF": row['rlhf'],
+                    "Weak Supervision": row['weak_supervision'],
+                    "Diffusion Reasoning": row['diffusion_reasoning'],
+                    "Distributed Training": row['distributed_training'],
+                    "Datasets": row['datasets']
                 },
                 "total": total_papers,
                 "url": f"{date}.html"
@@ -400,140 +1326,1720 @@ def get_landing_page_data() -> List[Dict[str, Any]]:
         logger.error(f"Database query failed: {e}")
         raise Exception(f"Failed to generate landing page data: {e}")
     finally:
-        conn.close()
+        if owns_connection:
+            conn.close()
+
+
+@dataclass(frozen=True)
+class PageOptions:
+    """Settings that change the content of generated date pages."""
+    max_papers: Optional[int] = None
+    compact_payload: bool = False
+    split_details: bool = False
+    detail_shard_size: int = DEFAULT_DETAIL_SHARD_SIZE
+    client_indexes: bool = False
+    author_index: bool = False
+
+
+def encode_compact_payload(paper_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert page data into the columnar payload expanded by decodePaperData()
+    in template.html: one array per field instead of one object per paper,
+    categorical fields as indexes into a small per-field lookup table, and
+    status fields the page never reads left out.
+    """
+    papers = paper_data['papers']
+    fields = [field for field in (papers[0] if papers else []) if field not in COMPACT_DROPPED_FIELDS]
+    
+    columns = []
+    dictionaries = {}
+    for field in fields:
+        values = [paper[field] for paper in papers]
+        if field in COMPACT_DICTIONARY_FIELDS:
+            lookup = {}
+            values = [lookup.setdefault(value, len(lookup)) for value in values]
+            dictionaries[field] = list(lookup)
+        columns.append(values)
+    
+    return {
+        "format": "columnar",
+        **{key: value for key, value in paper_data.items() if key != 'papers'},
+        "fields": fields,
+        "dictionaries": dictionaries,
+        "columns": columns
+    }
+
+
+def get_facet_bucket(field: str, value: Any) -> str:
+    """Bucket a categorical value the way the page's filter functions treat it."""
+    if value in FACET_VALUES[field]:
+        return value
+    if field == 'novelty_score':
+        # Missing novelty has its own filter option; an empty string always passes
+        if value is None:
+            return 'none'
+        if value == '':
+            return 'empty'
+    return 'other'
+
+
+def build_client_indexes(papers: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Precompute what the page would otherwise derive by scanning and sorting:
+    for each numeric sort key the permutation of paper positions (matching the
+    browser's stable sort), and for each filter dimension the positions in
+    each bucket, so filters become set intersections.
+    Title and id sorts use localeCompare and are still sorted in the browser.
+    """
+    def recommendation_value(paper):
+        if paper['llm_score_status'] == 'not_relevant_enough':
+            return 0
+        return (RECOMMENDATION_SORT_WEIGHTS.get(paper['recommendation_score'], 0)
+                + NOVELTY_SORT_WEIGHTS.get(paper['novelty_score'], 0)
+                + IMPACT_SORT_WEIGHTS.get(paper['impact_score'], 0))
+    
+    def relevance_value(paper):
+        # Only valid while every topic is selected in the topic filter
+        score = 0
+        for topic in RELEVANCE_TOPICS:
+            relevance = paper[f"{topic}_relevance"]
+            relevance = 'Not Relevant' if relevance == 'not_validated' else relevance
+            score += RELEVANCE_SORT_WEIGHTS.get(relevance, 1)
+        return score
+    
+    sort_keys = {
+        'recommend': [recommendation_value(paper) for paper in papers],
+        'relevance': [relevance_value(paper) for paper in papers],
+        'highest_hindex': [paper['highest_h_index'] or 0 for paper in papers],
+        'average_hindex': [paper['average_h_index'] or 0 for paper in papers]
+    }
+    positions = range(len(papers))
+    
+    def ascending(values):
+        return sorted(positions, key=lambda i: values[i])
+    
+    def descending(values):
+        return sorted(positions, key=lambda i: -values[i])
+    
+    sort_orders = {
+        'recommend_best': descending(sort_keys['recommend']),
+        'recommend_worst': ascending(sort_keys['recommend']),
+        'relevance_high': descending(sort_keys['relevance']),
+        'relevance_low': ascending(sort_keys['relevance']),
+        'highest_hindex_asc': ascending(sort_keys['highest_hindex']),
+        'highest_hindex_desc': descending(sort_keys['highest_hindex']),
+        'average_hindex_asc': ascending(sort_keys['average_hindex']),
+        'average_hindex_desc': descending(sort_keys['average_hindex'])
+    }
+    
+    facets = {}
+    for field in FACET_VALUES:
+        buckets = {}
+        for position, paper in enumerate(papers):
+            buckets.setdefault(get_facet_bucket(field, paper[field]), []).append(position)
+        facets[field] = buckets
+    for topic in RELEVANCE_TOPICS:
+        buckets = {}
+        for position, paper in enumerate(papers):
+            relevance = paper[f"{topic}_relevance"]
+            relevance = 'Not Relevant' if relevance == 'not_validated' else relevance
+            if relevance in RELEVANCE_SORT_WEIGHTS:
+                buckets.setdefault(relevance, []).append(position)
+        facets[f"{topic}_relevance"] = buckets
+    
+    return {"sort_orders": sort_orders, "facets": facets}
+
+
+def split_paper_details(date: str, paper_data: Dict[str, Any],
+                        shard_size: int = DEFAULT_DETAIL_SHARD_SIZE) -> (Dict[str, Any], List[Dict[str, Any]]):
+    """
+    Split page data into a small index embedded in the page and detail shards.
+    The index keeps every field used for filtering and sorting; the text-heavy
+    SPLIT_DETAIL_FIELDS go into shards of shard_size papers, keyed by paper id,
+    which the page fetches only for the papers it is about to show.
+    """
+    index_papers = []
+    shards = []
+    for position, paper in enumerate(paper_data['papers']):
+        if position % shard_size == 0:
+            shards.append({})
+        shards[-1][paper['id']] = {field: paper[field] for field in SPLIT_DETAIL_FIELDS}
+        index_papers.append({field: value for field, value in paper.items() if field not in SPLIT_DETAIL_FIELDS})
+    
+    index_data = {
+        **paper_data,
+        "papers": index_papers,
+        "detail_shards": {
+            "path": f"{DATA_DIRNAME}/{date}/",
+            "size": shard_size,
+            "count": len(shards)
+        }
+    }
+    return index_data, shards
+
+
+def write_detail_shards(date: str, shards: List[Dict[str, Any]]):
+    """Write a date's detail shards and remove leftovers from larger builds."""
+    shard_dir = os.path.join(OUTPUT_DIR, DATA_DIRNAME, date)
+    os.makedirs(shard_dir, exist_ok=True)
+    
+    shard_filenames = set()
+    for shard_id, shard in enumerate(shards):
+        shard_filename = f"details-{shard_id}.json"
+        shard_filenames.add(shard_filename)
+        write_json_file(os.path.join(shard_dir, shard_filename), shard)
+    
+    for filename in os.listdir(shard_dir):
+        if filename.startswith('details-') and filename not in shard_filenames:
+            os.remove(os.path.join(shard_dir, filename))
 
 
-def generate_static_page(date: str, paper_data: Dict[str, Any], template_content: str) -> str:
+def remove_stale_date_outputs(current_dates: set) -> int:
+    """
+    Delete the page, detail shards and precompressed sidecars of every date
+    that is no longer in the database. Returns the number of files removed.
+    """
+    removed = 0
+    for filename in os.listdir(OUTPUT_DIR):
+        page_filename = filename
+        for extension in SIDECAR_EXTENSIONS:
+            if page_filename.endswith(extension):
+                page_filename = page_filename[:-len(extension)]
+        match = DATE_PAGE_PATTERN.match(page_filename)
+        path = os.path.join(OUTPUT_DIR, filename)
+        if match and match.group(1) not in current_dates and os.path.isfile(path):
+            os.remove(path)
+            removed += 1
+    
+    data_dir = os.path.join(OUTPUT_DIR, DATA_DIRNAME)
+    if os.path.isdir(data_dir):
+        for date in os.listdir(data_dir):
+            shard_dir = os.path.join(data_dir, date)
+            if DATE_PAGE_PATTERN.match(f"{date}.html") and date not in current_dates and os.path.isdir(shard_dir):
+                removed += sum(len(filenames) for _, _, filenames in os.walk(shard_dir))
+                shutil.rmtree(shard_dir)
+    return removed
+
+
+def get_page_slot_values(date: str, paper_data: Optional[Dict[str, Any]],
+                         options: PageOptions = PageOptions(),
+                         data_chunks: Optional[Iterable[str]] = None) -> Dict[str, Union[str, Iterable[str]]]:
+    """
+    Build the slot values for a date page; the JSON payload is produced lazily.
+    Already serialized payload chunks can be passed instead of paper_data.
+    """
+    # Format date for titles
+    formatted_date = format_date_for_title(date)
+    page_title = f"Papers Published on {formatted_date}"
+    
+    if data_chunks is None and options.compact_payload:
+        data_chunks = iter_safe_json_chunks(encode_compact_payload(paper_data), minify=True)
+    elif data_chunks is None:
+        data_chunks = iter_safe_json_chunks(paper_data)
+    
+    return {
+        'title': formatted_date,
+        'mobile_title': page_title,
+        'desktop_title': page_title,
+        'data': data_chunks
+    }
+
+
+def generate_static_page(date: str, paper_data: Dict[str, Any], page_template: PageTemplate,
+                         options: PageOptions = PageOptions()) -> str:
     """
     Generate static HTML page by injecting paper data into template.
     """
     try:
-        # Format date for titles
-        formatted_date = format_date_for_title(date)
-        page_title = f"Papers Published on {formatted_date}"
-        
-        # Serialize paper data to JSON
-        json_data = safe_json_dumps(paper_data)
-        
-        # Replace placeholders in template
-        html_content = template_content
-        
-        # Replace title placeholders
-        html_content = html_content.replace('PLACEHOLDER_TITLE', formatted_date)
-        html_content = html_content.replace('PLACEHOLDER_MOBILE_TITLE', page_title)
-        html_content = html_content.replace('PLACEHOLDER_DESKTOP_TITLE', page_title)
-        
-        # Replace data placeholder
-        html_content = html_content.replace('<!--DATA_HERE-->', json_data)
+        return page_template.render(get_page_slot_values(date, paper_data, options))
         
-        return html_content
+    except Exception as e:
+        logger.error(f"Failed to generate page for {date}: {e}")
+        raise Exception(f"Page generation failed: {e}")
+
+
+def write_static_page(output_file: str, date: str, paper_data: Dict[str, Any], page_template: PageTemplate,
+                      options: PageOptions = PageOptions()):
+    """
+    Stream a static HTML page to disk, writing the JSON payload straight
+    into the file instead of building the whole page in memory.
+    """
+    try:
+        # 'render' covers template output and disk writes; its 'serialize' share is also reported apart
+        with profile_stage('render', date) as record:
+            values = get_page_slot_values(date, paper_data, options)
+            values['data'] = iter_profiled_chunks(values['data'], 'serialize', date)
+            page_template.write(output_file, values)
+            if record is not None:
+                record['bytes_written'] += os.path.getsize(output_file)
         
     except Exception as e:
         logger.error(f"Failed to generate page for {date}: {e}")
         raise Exception(f"Page generation failed: {e}")
 
 
-def generate_landing_page(landing_data: List[Dict[str, Any]], landing_template_content: str) -> str:
+def generate_landing_page(landing_data: List[Dict[str, Any]], landing_template: PageTemplate) -> str:
     """
     Generate landing page by injecting feed data into landing page template.
     """
     try:
-        # Serialize landing data to JSON
-        json_data = safe_json_dumps(landing_data)
+        return landing_template.render({'data': iter_safe_json_chunks(landing_data)})
         
-        # Replace data placeholder in landing page template
-        html_content = landing_template_content.replace('<!--LANDING_DATA_HERE-->', json_data)
-        
-        return html_content
+    except Exception as e:
+        logger.error(f"Failed to generate landing page: {e}")
+        raise Exception(f"Landing page generation failed: {e}")
+
+
+def write_landing_page(output_file: str, landing_data: Union[List[Dict[str, Any]], Dict[str, Any]],
+                       landing_template: PageTemplate):
+    """
+    Stream the landing page to disk. landing_data is the list of date
+    entries, or {"dates", "archive"} for a paginated landing page.
+    """
+    try:
+        with profile_stage('landing_render') as record:
+            landing_template.write(output_file, {
+                'data': iter_profiled_chunks(iter_safe_json_chunks(landing_data), 'landing_serialize')
+            })
+            if record is not None:
+                record['bytes_written'] += os.path.getsize(output_file)
         
     except Exception as e:
         logger.error(f"Failed to generate landing page: {e}")
         raise Exception(f"Landing page generation failed: {e}")
 
 
-def build_static_site(target_date: Optional[str] = None, max_papers: Optional[int] = None):
+def get_landing_month(entry: Dict[str, Any]) -> str:
+    """Month ('YYYY-MM') of a landing entry; entries link to '{YYYY-MM-DD}.html'."""
+    return entry['url'][:7]
+
+
+def update_landing_archive(manifest: Dict[str, Any], date_fingerprints: Dict[str, Dict[str, Any]],
+                           landing_template: PageTemplate, landing_dates: int, force: bool = False):
     """
-    Main build function - generates static HTML pages and landing page.
+    Write a paginated landing page: index.html embeds the newest landing_dates
+    dates plus the list of older months, and every month's entries go to
+    archive/YYYY-MM.json for landingpage.html to load on scroll. A month file
+    is only rewritten when one of its dates changed, so a new date touches
+    index.html and the current month's file.
     """
-    logger.info("Starting static site build")
+    dates = sorted(date_fingerprints, reverse=True)
+    month_dates = {}
+    for date in dates:
+        month_dates.setdefault(date[:7], {})[date] = date_fingerprints[date]
+    month_fingerprints = {
+        month: hash_text(json.dumps(fingerprints, sort_keys=True))
+        for month, fingerprints in month_dates.items()
+    }
+    
+    archive_dir = os.path.join(OUTPUT_DIR, ARCHIVE_DIRNAME)
+    archive = {
+        "path": f"{ARCHIVE_DIRNAME}/",
+        "months": sorted({date[:7] for date in dates[landing_dates:]}, reverse=True)
+    }
+    landing_fingerprint = {
+        "content": hash_text(json.dumps(
+            [{date: date_fingerprints[date] for date in dates[:landing_dates]}, archive], sort_keys=True
+        )),
+        "template": landing_template.content_hash,
+        "landing_dates": landing_dates
+    }
+    
+    previous_months = manifest.get('archive', {})
+    pending_months = [
+        month for month, fingerprint in month_fingerprints.items()
+        if force or previous_months.get(month) != fingerprint
+        or not os.path.exists(os.path.join(archive_dir, f"{month}.json"))
+    ]
+    landing_pending = force or not is_page_up_to_date(manifest, 'index.html', landing_fingerprint)
+    if not pending_months and not landing_pending:
+        logger.info("Skipping landing page and archive - unchanged since last build")
+        return
+    
+    logger.info("Generating landing page")
+    with profile_stage('landing_query') as record:
+        landing_data = get_landing_page_data()
+        if record is not None:
+            record['rows'] += len(landing_data)
+    
+    # Rewrite changed months and drop months that no longer have dates
+    os.makedirs(archive_dir, exist_ok=True)
+    month_entries = {}
+    for entry in landing_data:
+        month_entries.setdefault(get_landing_month(entry), []).append(entry)
+    for month in pending_months:
+        write_json_file(os.path.join(archive_dir, f"{month}.json"), month_entries.get(month, []))
+    for filename in os.listdir(archive_dir):
+        if filename.endswith('.json') and filename[:-len('.json')] not in month_fingerprints:
+            os.remove(os.path.join(archive_dir, filename))
+    manifest['archive'] = month_fingerprints
+    if pending_months:
+        logger.info(f"Wrote {len(pending_months)} archive month files to {archive_dir}")
+    
+    if landing_pending:
+        landing_output_file = os.path.join(OUTPUT_DIR, "index.html")
+        write_landing_page(landing_output_file, {"dates": landing_data[:landing_dates], "archive": archive},
+                           landing_template)
+        manifest['pages']['index.html'] = landing_fingerprint
+        logger.info(
+            f"Generated {landing_output_file} with {min(landing_dates, len(landing_data))} date entries "
+            f"and {len(archive['months'])} archive months"
+        )
+
+
+def get_page_data(date: str, options: PageOptions = PageOptions(),
+                  conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
+    """Query a date's papers and add the extras the page options ask for."""
+    # Get paper data for this date
+    paper_data = get_papers_for_date(date, options.max_papers, conn)
+    
+    if paper_data['total_papers'] == 0:
+        return paper_data
+    
+    # Precompute sort permutations and filter buckets for the page
+    if options.client_indexes:
+        with profile_stage('indexes', date):
+            paper_data = {**paper_data, "indexes": build_client_indexes(paper_data['papers'])}
+    
+    # Let the page look up each author's papers on other dates
+    if options.author_index:
+        paper_data = {**paper_data, "author_index": get_author_index_ref()}
+    
+    return paper_data
+
+
+def get_author_index_ref() -> Dict[str, Any]:
+    """Where a page finds the author index shards."""
+    return {"path": f"{AUTHORS_DIRNAME}/", "shard_count": AUTHOR_SHARD_COUNT}
+
+
+_payload_encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def encode_paper_fragment(paper: Dict[str, Any]) -> str:
+    """
+    Serialize one paper exactly as it appears in the default page payload:
+    re-indented to its nesting level and escaped for the <script> block.
+    Re-indenting is safe because encoded JSON only has newlines between tokens.
+    """
+    return escape_json_for_html(_payload_encoder.encode(paper).replace('\n', '\n    '))
+
+
+class FragmentCache:
+    """
+    Persistent cache of each paper's encode_paper_fragment() output, keyed by
+    paper id and a hash of its FORMAT_SELECT_SQL row plus FRAGMENT_CACHE_VERSION.
+    Unchanged papers are spliced into pages without being parsed, formatted
+    or encoded again. Kept in its own SQLite file because cache.db is opened
+    read-only; WAL mode lets --jobs workers share it.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(f"file:{quote(os.path.abspath(path))}", uri=True, timeout=FRAGMENT_CACHE_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS fragments (
+                id PRIMARY KEY,
+                source_hash TEXT NOT NULL,
+                fragment TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def hash_row(row: tuple) -> str:
+        return hashlib.blake2b(repr((FRAGMENT_CACHE_VERSION, row)).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get_fragments(self, rows: List[tuple], date: str) -> List[str]:
+        """Fragments for a batch of rows; formats and stores only new or changed papers."""
+        paper_ids = [row[0] for row in rows]
+        source_hashes = [self.hash_row(row) for row in rows]
+        
+        with profile_stage('fragment_cache', date):
+            cached = {
+                paper_id: (source_hash, fragment)
+                for paper_id, source_hash, fragment in self.conn.execute(
+                    f"SELECT id, source_hash, fragment FROM fragments WHERE id IN ({','.join('?' * len(paper_ids))})",
+                    paper_ids
+                )
+            }
+        
+        fragments = []
+        stale = []
+        for position, (paper_id, source_hash) in enumerate(zip(paper_ids, source_hashes)):
+            entry = cached.get(paper_id)
+            if entry is not None and entry[0] == source_hash:
+                fragments.append(entry[1])
+            else:
+                fragments.append(None)
+                stale.append(position)
+        
+        if stale:
+            with profile_stage('format', date) as record:
+                papers = format_paper_rows([rows[position] for position in stale])
+                for position, paper in zip(stale, papers):
+                    fragments[position] = encode_paper_fragment(paper)
+                if record is not None:
+                    record['rows'] += len(stale)
+            with profile_stage('fragment_cache', date):
+                with self.conn:
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO fragments (id, source_hash, fragment) VALUES (?, ?, ?)",
+                        [(paper_ids[position], source_hashes[position], fragments[position]) for position in stale]
+                    )
+        
+        self.hits += len(rows) - len(stale)
+        self.misses += len(stale)
+        return fragments
+    
+    def evict_missing(self) -> int:
+        """Drop fragments of papers that are no longer in the database."""
+        self.conn.execute("ATTACH DATABASE ? AS source", (f"file:{quote(os.path.abspath(DATABASE_PATH))}?mode=ro",))
+        try:
+            with self.conn:
+                return self.conn.execute(
+                    "DELETE FROM fragments WHERE id NOT IN (SELECT id FROM source.papers)"
+                ).rowcount
+        finally:
+            self.conn.execute("DETACH DATABASE source")
+    
+    def close(self):
+        self.conn.close()
+
+
+def iter_streamed_payload_chunks(date: str, batches: Iterator[List[str]],
+                                 options: PageOptions, counter: Dict[str, int],
+                                 buffer_size: int = JSON_WRITE_BUFFER_SIZE) -> Iterator[str]:
+    """
+    Join a page payload from per-paper fragments, byte-identical to
+    iter_safe_json_chunks() on the dict get_page_data() would return.
+    The number of papers written is kept in counter['total'].
+    """
+    pending = ['{\n  "papers": [']
+    pending_size = 0
+    separator = '\n    '
+    for batch in batches:
+        for fragment in batch:
+            pending.append(separator)
+            pending.append(fragment)
+            pending_size += len(fragment)
+            separator = ',\n    '
+            counter['total'] += 1
+            if pending_size >= buffer_size:
+                yield ''.join(pending)
+                pending = []
+                pending_size = 0
+    
+    # The keys after "papers", encoded as a dict without its opening brace
+    tail = {"total_papers": counter['total'], "date": date}
+    if options.author_index:
+        tail["author_index"] = get_author_index_ref()
+    pending.append(escape_json_for_html('\n  ],' + _payload_encoder.encode(tail)[1:]))
+    yield ''.join(pending)
+
+
+def stream_static_page(output_file: str, date: str, page_template: PageTemplate,
+                       options: PageOptions, conn: Optional[sqlite3.Connection],
+                       memory_limit: Optional[int] = None,
+                       fragment_cache: Optional[FragmentCache] = None) -> int:
+    """
+    Write a date page while fetching, formatting and serializing its papers
+    in batches (bounded by memory_limit, if given), so memory stays flat
+    however many papers the date has. With fragment_cache, unchanged papers
+    are taken from the cache. Only the default payload can be streamed.
+    Returns the number of papers written, or 0 if the date has no papers.
+    """
+    if fragment_cache is not None:
+        cache_hits = fragment_cache.hits
+        batches = (
+            fragment_cache.get_fragments(rows, date)
+            for rows in iter_paper_rows(date, options.max_papers, conn, memory_limit)
+        )
+    else:
+        batches = (
+            [encode_paper_fragment(paper) for paper in papers]
+            for papers in iter_papers_for_date(date, options.max_papers, conn, memory_limit)
+        )
+    first_batch = next(batches, None)
+    if first_batch is None:
+        logger.warning(f"No papers found for date {date}")
+        return 0
     
-    # Validate templates exist
-    if not os.path.exists(TEMPLATE_PATH):
-        raise FileNotFoundError(f"Template file not found: {TEMPLATE_PATH}")
-    if not os.path.exists(LANDING_PAGE_PATH):
-        raise FileNotFoundError(f"Landing page template not found: {LANDING_PAGE_PATH}")
+    def all_batches():
+        yield first_batch
+        yield from batches
     
-    # Read template contents
+    counter = {'total': 0}
     try:
-        with open(TEMPLATE_PATH, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        logger.info(f"Loaded template from {TEMPLATE_PATH}")
+        with profile_stage('render', date) as record:
+            data_chunks = iter_streamed_payload_chunks(date, all_batches(), options, counter)
+            values = get_page_slot_values(date, None, options, iter_profiled_chunks(data_chunks, 'serialize', date))
+            page_template.write(output_file, values)
+            if record is not None:
+                record['bytes_written'] += os.path.getsize(output_file)
         
-        with open(LANDING_PAGE_PATH, 'r', encoding='utf-8') as f:
-            landing_template_content = f.read()
-        logger.info(f"Loaded landing page template from {LANDING_PAGE_PATH}")
     except Exception as e:
-        raise Exception(f"Failed to read templates: {e}")
+        logger.error(f"Failed to generate page for {date}: {e}")
+        raise Exception(f"Page generation failed: {e}")
+    
+    if fragment_cache is not None:
+        logger.info(
+            f"Processed {counter['total']} papers for {date} "
+            f"({fragment_cache.hits - cache_hits} from fragment cache)"
+        )
+    else:
+        logger.info(f"Processed {counter['total']} papers for {date}")
+    return counter['total']
+
+
+def build_date_page(date: str, page_template: PageTemplate, options: PageOptions = PageOptions(),
+                    conn: Optional[sqlite3.Connection] = None, memory_limit: Optional[int] = None,
+                    fragment_cache: Optional[FragmentCache] = None) -> int:
+    """
+    Query, render and write the page for one date.
+    With memory_limit (bytes) or fragment_cache, the page is streamed paper
+    by paper instead.
+    Returns the number of papers written, or 0 if the date has no papers.
+    """
+    with profile_stage('page', date):
+        if memory_limit is not None or fragment_cache is not None:
+            return stream_static_page(os.path.join(OUTPUT_DIR, f"{date}.html"), date, page_template,
+                                      options, conn, memory_limit, fragment_cache)
+        
+        paper_data = get_page_data(date, options, conn)
+        
+        if paper_data['total_papers'] == 0:
+            return 0
+        
+        # Move text-heavy fields into separately fetched shards
+        if options.split_details:
+            with profile_stage('details', date):
+                paper_data, shards = split_paper_details(date, paper_data, options.detail_shard_size)
+                write_detail_shards(date, shards)
+        
+        # Stream HTML page to file
+        output_file = os.path.join(OUTPUT_DIR, f"{date}.html")
+        write_static_page(output_file, date, paper_data, page_template, options)
+        
+        return paper_data['total_papers']
+
+
+# Per-process state for parallel builds, set up once by _init_build_worker
+_worker_page_template = None
+_worker_memory_limit = None
+_worker_fragment_cache = None
+
+
+def _init_build_worker(page_template: PageTemplate, database_path: str, output_dir: str,
+                       profile: bool = False, memory_limit: Optional[int] = None,
+                       immutable_db: bool = False, fragment_cache_path: Optional[str] = None):
+    """Process pool initializer: keep the template and one read-only connection per worker."""
+    global _worker_page_template, _shared_conn, _worker_memory_limit, _worker_fragment_cache, _profiler
+    global DATABASE_PATH, OUTPUT_DIR
+    DATABASE_PATH = database_path
+    OUTPUT_DIR = output_dir
+    _worker_page_template = page_template
+    # Replaces the parent's connection inherited on fork
+    _shared_conn = get_readonly_db_connection(immutable_db, memory_limit)
+    _worker_memory_limit = memory_limit
+    _worker_fragment_cache = FragmentCache(fragment_cache_path) if fragment_cache_path else None
+    _profiler = BuildProfiler() if profile else None
+
+
+def _build_date_page_worker(date: str, options: PageOptions) -> (int, Optional[List[tuple]]):
+    """Build one date inside a pool worker; also returns its profile records, if any."""
+    total_papers = build_date_page(date, _worker_page_template, options, memory_limit=_worker_memory_limit,
+                                   fragment_cache=_worker_fragment_cache)
+    return total_papers, _profiler.export() if _profiler is not None else None
+
+
+def get_compression_formats() -> List[str]:
+    """Sidecar extensions that can be produced in this environment."""
+    return ['gz', 'br'] if brotli is not None else ['gz']
+
+
+def compress_output_file(path: str, formats: List[str]) -> Dict[str, int]:
+    """
+    Write precompressed sidecars (path.gz, path.br) for one file.
+    Returns the byte size of the original and of each sidecar.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    sizes = {'original': len(data)}
+    for fmt in formats:
+        if fmt == 'gz':
+            # mtime=0 keeps the output identical for identical input
+            compressed = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+        else:
+            compressed = brotli.compress(data, quality=BROTLI_QUALITY)
+        write_output_file(f"{path}.{fmt}", [compressed])
+        sizes[fmt] = len(compressed)
+    return sizes
+
+
+def precompress_outputs(manifest: Dict[str, Any], jobs: int = 1):
+    """
+    Generate .gz/.br sidecars for every text output in OUTPUT_DIR.
+    A file is only recompressed when its content hash differs from the one
+    recorded in the manifest at the time its sidecars were written.
+    Sidecars whose original file no longer exists are deleted.
+    """
+    formats = get_compression_formats()
+    if brotli is None:
+        logger.warning("brotli module not installed, writing .gz sidecars only")
+    
+    # Find outputs whose bytes changed since they were last compressed
+    pending = []
+    current_files = set()
+    orphaned = 0
+    for root, _, filenames in os.walk(OUTPUT_DIR):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            if filename.endswith(SIDECAR_EXTENSIONS):
+                if not os.path.exists(os.path.splitext(path)[0]):
+                    os.remove(path)
+                    orphaned += 1
+                continue
+            if not filename.endswith(COMPRESSIBLE_EXTENSIONS) or filename in (MANIFEST_FILENAME, DEPLOY_MANIFEST_FILENAME):
+                continue
+            rel_path = os.path.relpath(path, OUTPUT_DIR).replace(os.sep, '/')
+            current_files.add(rel_path)
+            
+            content_hash = hash_file(path)
+            sidecars_exist = all(os.path.exists(f"{path}.{fmt}") for fmt in formats)
+            if sidecars_exist and manifest['compressed'].get(rel_path) == content_hash:
+                continue
+            pending.append((rel_path, path, content_hash))
     
-    # Create output directory
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    logger.info(f"Output directory: {OUTPUT_DIR}")
+    # Forget files that no longer exist
+    for rel_path in list(manifest['compressed']):
+        if rel_path not in current_files:
+            del manifest['compressed'][rel_path]
+    if orphaned:
+        logger.info(f"Removed {orphaned} sidecars of deleted outputs")
     
-    # Get dates to process
-    if target_date:
-        dates = [target_date]
-        logger.info(f"Building single date: {target_date}")
+    if not pending:
+        logger.info("Precompressed sidecars are up to date")
+        return
+    
+    logger.info(f"Compressing {len(pending)} files ({', '.join(formats)})")
+    totals = {'original': 0, **{fmt: 0 for fmt in formats}}
+    
+    def record(rel_path: str, content_hash: str, sizes: Dict[str, int]):
+        manifest['compressed'][rel_path] = content_hash
+        for key, size in sizes.items():
+            totals[key] += size
+        ratios = ', '.join(f"{fmt} {sizes['original'] / max(sizes[fmt], 1):.1f}x" for fmt in formats)
+        logger.debug(f"Compressed {rel_path}: {ratios}")
+    
+    if jobs > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(compress_output_file, path, formats): (rel_path, content_hash)
+                for rel_path, path, content_hash in pending
+            }
+            for future in as_completed(futures):
+                rel_path, content_hash = futures[future]
+                try:
+                    record(rel_path, content_hash, future.result())
+                except Exception as e:
+                    raise Exception(f"Compression failed for {rel_path}: {e}")
     else:
-        dates = get_all_dates()
-        logger.info(f"Building all dates: {len(dates)} total")
+        for rel_path, path, content_hash in pending:
+            try:
+                record(rel_path, content_hash, compress_output_file(path, formats))
+            except Exception as e:
+                raise Exception(f"Compression failed for {rel_path}: {e}")
     
-    # Process each date
-    built_pages = 0
-    for date in dates:
-        try:
-            logger.info(f"Processing {date}")
+    for fmt in formats:
+        ratio = totals['original'] / max(totals[fmt], 1)
+        logger.info(
+            f"Compression summary ({fmt}): {totals['original']:,} -> {totals[fmt]:,} bytes "
+            f"({ratio:.1f}x) across {len(pending)} files"
+        )
+
+
+def search_tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split text into normalised search terms: accents stripped, lowercased,
+    alphanumeric runs only, without stopwords or very short/long tokens.
+    """
+    if not text:
+        return []
+    decomposed = unicodedata.normalize('NFKD', text)
+    text = ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+    return [
+        token for token in SEARCH_TOKEN_PATTERN.findall(text)
+        if SEARCH_PREFIX_LENGTH <= len(token) <= SEARCH_MAX_TOKEN_LENGTH and token not in SEARCH_STOPWORDS
+    ]
+
+
+def get_search_shard_path(prefix: str) -> str:
+    """Term shard file for a prefix; hex keeps non-ASCII prefixes URL/filesystem safe."""
+    return os.path.join(OUTPUT_DIR, SEARCH_DIRNAME, f"terms-{prefix.encode('utf-8').hex()}.json")
+
+
+def get_search_doc_shard_path(shard_id: int) -> str:
+    """Document table shard holding [paper_id, date, title] rows."""
+    return os.path.join(OUTPUT_DIR, SEARCH_DIRNAME, f"docs-{shard_id}.json")
+
+
+def get_search_chunk_path(chunk_id: int) -> str:
+    """Continuation chunk holding an older doc-id range of one term's postings."""
+    return os.path.join(OUTPUT_DIR, SEARCH_DIRNAME, f"chunks-{chunk_id}.json")
+
+
+def read_json_file(path: str, default: Any) -> Any:
+    """Load a JSON file written by the builder, or return default if missing."""
+    if not os.path.exists(path):
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json_file(path: str, data: Any):
+    """Write minified JSON."""
+    write_output_file(path, [json.dumps(data, ensure_ascii=False, separators=(',', ':'))])
+
+
+def find_search_prefix(term: str, prefixes: set) -> Optional[str]:
+    """Longest shard prefix the term starts with (same lookup as the client)."""
+    for length in range(len(term), SEARCH_PREFIX_LENGTH - 1, -1):
+        if term[:length] in prefixes:
+            return term[:length]
+    return None
+
+
+def get_search_documents(date: str) -> List[Dict[str, Any]]:
+    """Read the searchable fields of every paper on a date."""
+    conn, owns_connection = acquire_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT id, title, authors, abstract, summary
+            FROM papers 
+            WHERE DATE(published_date) = ?
+            ORDER BY id ASC
+        """, (date,))
+        return [
+            {
+                "id": row['id'],
+                "title": row['title'],
+                "authors": ' '.join(str(author) for author in parse_json_field(row['authors'])),
+                "abstract": row['abstract'],
+                "summary": row['summary']
+            }
+            for row in cursor.fetchall()
+        ]
+        
+    except sqlite3.Error as e:
+        logger.error(f"Database query failed for {date}: {e}")
+        raise Exception(f"Failed to query search documents for {date}: {e}")
+    finally:
+        if owns_connection:
+            conn.close()
+
+
+def encode_search_postings(postings: Iterable[tuple]) -> List[int]:
+    """Encode (doc, weight) pairs in increasing doc order as [doc delta, weight, ...]."""
+    encoded = []
+    last_doc = 0
+    for doc, weight in postings:
+        encoded.extend((doc - last_doc, weight))
+        last_doc = doc
+    return encoded
+
+
+def split_search_postings(entry: Union[List[int], Dict[str, Any]], state: Dict[str, Any]) -> Union[List[int], Dict[str, Any]]:
+    """
+    Move the oldest postings of a long term entry into continuation chunks of
+    SEARCH_CHUNK_POSTINGS postings each, so neither the term shard nor any one
+    file grows with the number of matching documents. The entry becomes
+    {"postings": newest postings, "chunks": [[chunk_id, first_doc, last_doc,
+    count, max_weight], ...], "top": [doc, weight, ...]} with chunks in doc
+    order (last_doc exclusive) and top holding the SEARCH_TOP_POSTINGS best
+    chunked postings, so single-term searches can rank without the chunks.
+    """
+    if isinstance(entry, dict):
+        postings, chunks, top = entry['postings'], entry['chunks'], entry['top']
+    else:
+        postings, chunks, top = entry, [], []
+    if len(postings) < 2 * SEARCH_CHUNK_POSTINGS:
+        return entry
+    
+    docs = []
+    last_doc = 0
+    for delta in postings[0::2]:
+        last_doc += delta
+        docs.append(last_doc)
+    pairs = list(zip(docs, postings[1::2]))
+    sealed = len(pairs) - len(pairs) % SEARCH_CHUNK_POSTINGS
+    for start in range(0, sealed, SEARCH_CHUNK_POSTINGS):
+        chunk = pairs[start:start + SEARCH_CHUNK_POSTINGS]
+        chunk_id = state['next_chunk']
+        state['next_chunk'] += 1
+        write_json_file(get_search_chunk_path(chunk_id), encode_search_postings(chunk))
+        chunks.append([chunk_id, chunk[0][0], chunk[-1][0] + 1, len(chunk), max(weight for _, weight in chunk)])
+    
+    # Same order as the client ranking: weight, then newest document
+    best = sorted(list(zip(top[0::2], top[1::2])) + pairs[:sealed], key=lambda pair: (-pair[1], -pair[0]))
+    return {
+        "postings": encode_search_postings(pairs[sealed:]),
+        "chunks": chunks,
+        "top": [value for pair in best[:SEARCH_TOP_POSTINGS] for value in pair]
+    }
+
+
+def write_search_term_shard(prefix: str, terms: Dict[str, Any], prefixes: set) -> int:
+    """
+    Write a term shard, splitting it into longer prefixes while it is over
+    SEARCH_MAX_SHARD_BYTES. Terms no longer than the prefix stay in place.
+    Returns the number of shard files written, including split children.
+    """
+    encoded = json.dumps(terms, ensure_ascii=False, separators=(',', ':'))
+    splittable = [term for term in terms if len(term) > len(prefix)]
+    if len(encoded.encode('utf-8')) > SEARCH_MAX_SHARD_BYTES and splittable:
+        children = {}
+        for term in splittable:
+            children.setdefault(term[:len(prefix) + 1], {})[term] = terms.pop(term)
+        written = 0
+        for child_prefix, child_terms in children.items():
+            # A child may already exist if a term was too short to match it before
+            existing = read_json_file(get_search_shard_path(child_prefix), {})
+            existing.update(child_terms)
+            prefixes.add(child_prefix)
+            written += write_search_term_shard(child_prefix, existing, prefixes)
+        encoded = json.dumps(terms, ensure_ascii=False, separators=(',', ':'))
+        write_output_file(get_search_shard_path(prefix), [encoded])
+        return written + 1
+    
+    write_output_file(get_search_shard_path(prefix), [encoded])
+    return 1
+
+
+def update_search_index(manifest: Dict[str, Any], date_fingerprints: Dict[str, Dict[str, Any]],
+                        full_build: bool, force: bool = False):
+    """
+    Incrementally maintain a static inverted index over title, authors,
+    abstract and summary for every date.
+    
+    Layout under OUTPUT_DIR/search:
+      index.json      - shard prefixes, document count and deleted doc ranges
+      terms-<hex>.json - {term: [doc delta, weight, doc delta, weight, ...]}, or for
+                         long lists {term: {"postings": [...], "chunks": [...], "top": [...]}}
+      chunks-<n>.json - [doc delta, weight, ...] for an older doc range of one term
+      docs-<n>.json   - [[paper_id, date, title] or null, ...]
+    
+    Only dates whose content fingerprint changed are (re)indexed. Their new
+    documents get fresh, increasing numbers, so postings are only ever
+    appended; replaced documents are recorded as deleted ranges and blanked
+    in the document table. Once
+    too many documents are blanked the index is rebuilt from scratch.
+    Single-date builds (full_build False) only see their own date, so they
+    never rebuild from scratch: force re-indexes just the given dates, and a
+    rebuild for blanked documents waits for the next full build.
+    """
+    search_dir = os.path.join(OUTPUT_DIR, SEARCH_DIRNAME)
+    index_path = os.path.join(search_dir, 'index.json')
+    state = manifest.get('search')
+    
+    if (force and full_build) or not state or state.get('version') != SEARCH_INDEX_VERSION or not os.path.exists(index_path):
+        logger.info("Building search index from scratch")
+        shutil.rmtree(search_dir, ignore_errors=True)
+        state = {"version": SEARCH_INDEX_VERSION, "next_doc": 0, "next_chunk": 0, "deleted": [], "dates": {}, "prefixes": []}
+    os.makedirs(search_dir, exist_ok=True)
+    
+    changed_dates = sorted(
+        date for date, fingerprint in date_fingerprints.items()
+        if (force and not full_build) or state['dates'].get(date, {}).get('content') != fingerprint['content']
+    )
+    removed_dates = sorted(set(state['dates']) - set(date_fingerprints)) if full_build else []
+    
+    # Blank out documents of dates that are being replaced or removed
+    stale_ranges = [state['dates'].pop(date) for date in changed_dates + removed_dates if date in state['dates']]
+    deleted = state['deleted'] + [[entry['first_doc'], entry['last_doc']] for entry in stale_ranges]
+    if sum(last - first for first, last in deleted) > SEARCH_REBUILD_DELETED_RATIO * state['next_doc']:
+        if full_build:
+            logger.info("Too many replaced documents in search index, rebuilding")
+            manifest.pop('search', None)
+            return update_search_index(manifest, date_fingerprints, full_build, force=True)
+        if stale_ranges:
+            logger.info("Too many replaced documents in search index; it will be rebuilt by the next full build")
+    
+    if not changed_dates and not removed_dates:
+        logger.info("Search index is up to date")
+        manifest['search'] = state
+        return
+    
+    doc_shards = {}
+    
+    def load_doc_shard(shard_id):
+        if shard_id not in doc_shards:
+            doc_shards[shard_id] = read_json_file(get_search_doc_shard_path(shard_id), [])
+        return doc_shards[shard_id]
+    
+    for entry in stale_ranges:
+        for doc in range(entry['first_doc'], entry['last_doc']):
+            load_doc_shard(doc // SEARCH_DOCS_PER_SHARD)[doc % SEARCH_DOCS_PER_SHARD] = None
+    state['deleted'] = sorted(deleted)
+    
+    # Tokenize new documents and collect their postings
+    new_postings = {}
+    for date in changed_dates:
+        first_doc = state['next_doc']
+        for document in get_search_documents(date):
+            doc = state['next_doc']
+            state['next_doc'] += 1
+            load_doc_shard(doc // SEARCH_DOCS_PER_SHARD).append([document['id'], date, document['title']])
             
-            # Get paper data for this date
-            paper_data = get_papers_for_date(date, max_papers)
+            weights = {}
+            for field, field_weight in SEARCH_FIELD_WEIGHTS.items():
+                for term in search_tokenize(document[field]):
+                    weights[term] = weights.get(term, 0) + field_weight
+            for term, weight in weights.items():
+                new_postings.setdefault(term, []).append((doc, weight))
+        state['dates'][date] = {
+            "content": date_fingerprints[date]['content'],
+            "first_doc": first_doc,
+            "last_doc": state['next_doc']
+        }
+    
+    for shard_id, rows in doc_shards.items():
+        write_json_file(get_search_doc_shard_path(shard_id), rows)
+    
+    # Append postings to the term shards they belong to
+    prefixes = set(state['prefixes'])
+    touched = {}
+    for term, postings in new_postings.items():
+        prefix = find_search_prefix(term, prefixes)
+        if prefix is None:
+            prefix = term[:SEARCH_PREFIX_LENGTH]
+            prefixes.add(prefix)
+        touched.setdefault(prefix, {})[term] = postings
+    
+    written_shards = 0
+    first_chunk = state['next_chunk']
+    for prefix, shard_postings in touched.items():
+        terms = read_json_file(get_search_shard_path(prefix), {})
+        for term, postings in shard_postings.items():
+            entry = terms.get(term, [])
+            encoded = entry['postings'] if isinstance(entry, dict) else entry
+            last_doc = sum(encoded[0::2])
+            for doc, weight in postings:
+                encoded.extend((doc - last_doc, weight))
+                last_doc = doc
+            terms[term] = split_search_postings(entry, state)
+        written_shards += write_search_term_shard(prefix, terms, prefixes)
+    
+    state['prefixes'] = sorted(prefixes)
+    write_json_file(index_path, {
+        "version": SEARCH_INDEX_VERSION,
+        "prefix_length": SEARCH_PREFIX_LENGTH,
+        "docs_per_shard": SEARCH_DOCS_PER_SHARD,
+        "doc_count": state['next_doc'],
+        "deleted": state['deleted'],
+        "prefixes": state['prefixes']
+    })
+    manifest['search'] = state
+    logger.info(
+        f"Search index updated: {len(changed_dates)} dates indexed, {len(removed_dates)} removed, "
+        f"{written_shards} term shards written ({len(prefixes)} total), "
+        f"{state['next_chunk'] - first_chunk} postings chunks written"
+    )
+
+
+def get_author_key(name: str) -> str:
+    """Normalise an author name for lookup: accents and punctuation stripped, lowercased."""
+    decomposed = unicodedata.normalize('NFKD', name)
+    text = ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+    return re.sub(r'[\W_]+', ' ', text).strip()
+
+
+def get_author_shard(key: str) -> int:
+    """FNV-1a hash of the UTF-8 key, reduced to a shard number."""
+    value = 0x811c9dc5
+    for byte in key.encode('utf-8'):
+        value = ((value ^ byte) * 0x01000193) & 0xffffffff
+    return value % AUTHOR_SHARD_COUNT
+
+
+def iter_paper_authors() -> Iterator[tuple]:
+    """
+    Stream (paper_id, date, author_h_indexes) for every dated paper, newest
+    first, parsing each author_h_indexes field exactly once.
+    """
+    conn, owns_connection = acquire_db_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT id, DATE(published_date) AS date, author_h_indexes
+            FROM papers 
+            WHERE DATE(published_date) IS NOT NULL AND author_h_indexes IS NOT NULL
+            ORDER BY DATE(published_date) DESC, id ASC
+        """)
+        for row in cursor:
+            yield row['id'], row['date'], parse_json_field(row['author_h_indexes'])
+            
+    except sqlite3.Error as e:
+        logger.error(f"Database query failed for author index: {e}")
+        raise Exception(f"Failed to query authors: {e}")
+    finally:
+        if owns_connection:
+            conn.close()
+
+
+def build_author_index() -> int:
+    """
+    Aggregate author_h_indexes across the archive into OUTPUT_DIR/authors:
+      index.json       - shard count and number of authors
+      authors-<n>.json - {author key: {name, h_index, profile_url, papers}}
+    where h_index is the best value seen for the author and papers lists
+    [paper_id, date] pairs newest first. Returns the number of authors.
+    """
+    authors = {}
+    for paper_id, date, author_h_indexes in iter_paper_authors():
+        for author_info in author_h_indexes:
+            if not isinstance(author_info, dict) or not author_info.get('name'):
+                continue
+            key = get_author_key(author_info['name'])
+            if not key:
+                continue
             
-            if paper_data['total_papers'] == 0:
+            entry = authors.get(key)
+            if entry is None:
+                entry = authors[key] = {"name": author_info['name'], "h_index": None, "profile_url": None, "papers": []}
+            h_index = author_info.get('h_index')
+            if isinstance(h_index, (int, float)) and (entry['h_index'] is None or h_index > entry['h_index']):
+                entry['h_index'] = h_index
+                entry['profile_url'] = author_info.get('profile_url')
+            if not entry['papers'] or entry['papers'][-1][0] != paper_id:
+                entry['papers'].append([paper_id, date])
+    
+    shards = [{} for _ in range(AUTHOR_SHARD_COUNT)]
+    for key, entry in authors.items():
+        shards[get_author_shard(key)][key] = entry
+    
+    authors_dir = os.path.join(OUTPUT_DIR, AUTHORS_DIRNAME)
+    os.makedirs(authors_dir, exist_ok=True)
+    for shard_id, shard in enumerate(shards):
+        write_json_file(os.path.join(authors_dir, f"authors-{shard_id}.json"), shard)
+    write_json_file(os.path.join(authors_dir, 'index.json'), {
+        "version": AUTHOR_INDEX_VERSION,
+        "shard_count": AUTHOR_SHARD_COUNT,
+        "author_count": len(authors)
+    })
+    
+    return len(authors)
+
+
+def build_static_site(target_date: Optional[str] = None, max_papers: Optional[int] = None,
+                      create_index: bool = False, force: bool = False, jobs: int = 1,
+                      external_assets: bool = False, compact_payload: bool = False,
+                      precompress: bool = False, split_details: bool = False,
+                      detail_shard_size: int = DEFAULT_DETAIL_SHARD_SIZE, client_indexes: bool = False,
+                      search_index: bool = False, author_index: bool = False,
+                      profile: Optional[str] = None, profile_dump: bool = False,
+                      memory_limit: Optional[int] = None, immutable_db: bool = False,
+                      landing_dates: Optional[int] = None, fragment_cache: Optional[str] = None,
+                      check_date_index: bool = True, conn: Optional[sqlite3.Connection] = None):
+    """
+    Main build function - generates static HTML pages and landing page.
+    Pages whose inputs are unchanged since the last build are skipped
+    unless force is set. With jobs > 1 dates are built in a process pool.
+    Files are only replaced when their bytes change, and deploy-manifest.json
+    lists what was added, changed or removed since the previous build.
+    With external_assets, inline CSS/JS is served from shared hashed files.
+    With compact_payload, paper data is embedded in the columnar format.
+    With precompress, .gz/.br sidecars are written for changed outputs.
+    With split_details, text-heavy fields are written to lazily fetched shards.
+    With client_indexes, pages embed precomputed sort orders and filter facets.
+    With search_index, a static cross-date search index is kept up to date.
+    With author_index, an author index is built and pages link authors to it.
+    With profile, per-stage/per-date timings are written to that JSON path,
+    and with profile_dump the slowest date is rebuilt under cProfile.
+    With memory_limit (bytes), date pages are streamed paper by paper.
+    Reads share one read-only connection; immutable_db opens it as an
+    immutable snapshot (only safe when nothing writes to the database).
+    With landing_dates, index.html embeds only that many of the newest dates
+    and older dates are listed in monthly archive files.
+    With fragment_cache, each paper's serialized JSON is kept in that SQLite
+    file and reused until the paper's row changes.
+    check_date_index=False skips the date index check, and conn replaces the
+    build's own read-only connection; --watch uses both across rebuilds.
+    """
+    global _profiler
+    _profiler = BuildProfiler() if profile else None
+    logger.info("Starting static site build")
+    
+    # Check that date queries can use an index instead of scanning papers
+    if check_date_index:
+        ensure_date_index(create=create_index)
+    
+    # Serve every read of this build from one tuned read-only connection
+    with shared_db_connection(immutable_db, memory_limit, conn):
+        # Load and compile templates
+        page_template = load_template(TEMPLATE_PATH, PAGE_TEMPLATE_SLOTS, external_assets)
+        landing_template = load_template(LANDING_PAGE_PATH, LANDING_TEMPLATE_SLOTS, external_assets)
+        
+        # Create output directory
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        logger.info(f"Output directory: {OUTPUT_DIR}")
+        
+        # Write shared assets before any page that references them
+        if external_assets:
+            written_assets = write_template_assets(page_template) + write_template_assets(landing_template)
+            logger.info(f"Wrote {written_assets} new asset files to {os.path.join(OUTPUT_DIR, ASSETS_DIRNAME)}")
+        
+        # Get dates to process
+        if target_date:
+            dates = [target_date]
+            logger.info(f"Building single date: {target_date}")
+        else:
+            dates = get_all_dates()
+            logger.info(f"Building all dates: {len(dates)} total")
+        
+        # Fingerprint the inputs of every page to decide what needs rebuilding
+        manifest = load_build_manifest()
+        if force:
+            manifest['dates'].clear()
+        with profile_stage('fingerprints'):
+            date_fingerprints = get_date_fingerprints(target_date, cache=manifest['dates'])
+        template_hash = page_template.content_hash
+        page_options = PageOptions(
+            max_papers=max_papers,
+            compact_payload=compact_payload,
+            split_details=split_details,
+            detail_shard_size=detail_shard_size,
+            client_indexes=client_indexes,
+            author_index=author_index
+        )
+        if force:
+            logger.info("Forcing rebuild of all pages")
+        fragments = FragmentCache(fragment_cache) if fragment_cache else None
+        
+        # Work out which dates need rebuilding
+        pending = []
+        skipped_pages = 0
+        for date in dates:
+            fingerprint = {
+                **date_fingerprints.get(date, {"rows": 0, "content": None}),
+                "template": template_hash,
+                "options": asdict(page_options)
+            }
+            if not force and is_page_up_to_date(manifest, f"{date}.html", fingerprint):
+                logger.debug(f"Skipping {date} - unchanged since last build")
+                skipped_pages += 1
+                continue
+            pending.append((date, fingerprint))
+        
+        def record_result(date: str, fingerprint: Dict[str, Any], total_papers: int):
+            page_filename = f"{date}.html"
+            if total_papers == 0:
                 logger.warning(f"Skipping {date} - no papers found")
+                manifest['pages'].pop(page_filename, None)
+                return 0
+            manifest['pages'][page_filename] = fingerprint
+            logger.info(f"Generated {os.path.join(OUTPUT_DIR, page_filename)} with {total_papers} papers")
+            return 1
+        
+        # Process each date
+        built_pages = 0
+        if jobs > 1 and len(pending) > 1:
+            logger.info(f"Building {len(pending)} dates with {jobs} parallel jobs")
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_build_worker,
+                initargs=(page_template, DATABASE_PATH, OUTPUT_DIR, _profiler is not None, memory_limit, immutable_db, fragment_cache)
+            ) as executor:
+                futures = {
+                    executor.submit(_build_date_page_worker, date, page_options): (date, fingerprint)
+                    for date, fingerprint in pending
+                }
+                for future in as_completed(futures):
+                    date, fingerprint = futures[future]
+                    try:
+                        total_papers, profile_records = future.result()
+                        if profile_records:
+                            _profiler.merge(profile_records)
+                        built_pages += record_result(date, fingerprint, total_papers)
+                    except Exception as e:
+                        logger.error(f"Failed to build page for {date}: {e}")
+                        for other in futures:
+                            other.cancel()
+                        save_build_manifest(manifest)
+                        raise Exception(f"Build failed for {date}: {e}")
+        else:
+            for date, fingerprint in pending:
+                try:
+                    logger.info(f"Processing {date}")
+                    built_pages += record_result(date, fingerprint, build_date_page(
+                        date, page_template, page_options, memory_limit=memory_limit, fragment_cache=fragments
+                    ))
+                except Exception as e:
+                    logger.error(f"Failed to build page for {date}: {e}")
+                    save_build_manifest(manifest)
+                    raise Exception(f"Build failed for {date}: {e}")
+        
+        if skipped_pages:
+            logger.info(f"Skipped {skipped_pages} unchanged pages")
+        
+        # Forget fragments of deleted papers (needs the whole database, so full builds only)
+        if fragments is not None:
+            if fragments.hits or fragments.misses:
+                logger.info(f"Fragment cache: {fragments.hits} papers reused, {fragments.misses} serialized")
+            if not target_date:
+                evicted = fragments.evict_missing()
+                if evicted:
+                    logger.info(f"Evicted {evicted} stale fragments from {fragments.path}")
+            fragments.close()
+        
+        # Generate landing page (only if building all dates or no specific date was requested)
+        if not target_date:
+            # Drop manifest entries and outputs of dates that no longer exist
+            current_pages = {f"{date}.html" for date in date_fingerprints}
+            for page_filename in list(manifest['pages']):
+                if page_filename != 'index.html' and page_filename not in current_pages:
+                    del manifest['pages'][page_filename]
+            stale_outputs = remove_stale_date_outputs(set(date_fingerprints))
+            if stale_outputs:
+                logger.info(f"Removed {stale_outputs} output files of dates no longer in the database")
+            
+            landing_fingerprint = {
+                "content": hash_text(json.dumps(date_fingerprints, sort_keys=True)),
+                "template": landing_template.content_hash
+            }
+            if landing_dates:
+                try:
+                    update_landing_archive(manifest, date_fingerprints, landing_template, landing_dates, force)
+                except Exception as e:
+                    logger.error(f"Failed to build landing page: {e}")
+                    save_build_manifest(manifest)
+                    raise Exception(f"Landing page build failed: {e}")
+            elif not force and is_page_up_to_date(manifest, 'index.html', landing_fingerprint):
+                logger.info("Skipping landing page - unchanged since last build")
+            else:
+                try:
+                    logger.info("Generating landing page")
+                    with profile_stage('landing_query') as record:
+                        landing_data = get_landing_page_data()
+                        if record is not None:
+                            record['rows'] += len(landing_data)
+                    
+                    # Write landing page to output directory
+                    landing_output_file = os.path.join(OUTPUT_DIR, "index.html")
+                    write_landing_page(landing_output_file, landing_data, landing_template)
+                    
+                    manifest['pages']['index.html'] = landing_fingerprint
+                    logger.info(f"Generated {landing_output_file} with {len(landing_data)} date entries")
+                    
+                except Exception as e:
+                    logger.error(f"Failed to build landing page: {e}")
+                    save_build_manifest(manifest)
+                    raise Exception(f"Landing page build failed: {e}")
+        
+        # Rebuild the author index when any date changed (needs every date)
+        if author_index and not target_date:
+            author_fingerprint = {
+                "version": AUTHOR_INDEX_VERSION,
+                "content": hash_text(json.dumps(date_fingerprints, sort_keys=True))
+            }
+            author_index_path = os.path.join(OUTPUT_DIR, AUTHORS_DIRNAME, 'index.json')
+            if not force and manifest.get('authors') == author_fingerprint and os.path.exists(author_index_path):
+                logger.info("Skipping author index - unchanged since last build")
+            else:
+                try:
+                    logger.info("Building author index")
+                    with profile_stage('author_index'):
+                        author_count = build_author_index()
+                    manifest['authors'] = author_fingerprint
+                    logger.info(f"Wrote author index with {author_count} authors")
+                except Exception as e:
+                    logger.error(f"Failed to build author index: {e}")
+                    save_build_manifest(manifest)
+                    raise Exception(f"Author index build failed: {e}")
+        
+        # Update the cross-date search index for new or changed dates
+        if search_index:
+            try:
+                with profile_stage('search_index'):
+                    update_search_index(manifest, date_fingerprints, full_build=not target_date, force=force)
+            except Exception as e:
+                logger.error(f"Failed to update search index: {e}")
+                save_build_manifest(manifest)
+                raise Exception(f"Search index build failed: {e}")
+        
+        # Precompress changed outputs for the static host
+        if precompress:
+            try:
+                with profile_stage('precompress'):
+                    precompress_outputs(manifest, jobs)
+            except Exception as e:
+                logger.error(f"Failed to precompress outputs: {e}")
+                save_build_manifest(manifest)
+                raise
+        
+        # Record what changed on disk so the deploy step can upload only that
+        with profile_stage('deploy_manifest'):
+            delta = update_deploy_manifest(manifest)
+        logger.info(
+            f"Deploy delta: {delta['added']} added, {delta['changed']} changed, "
+            f"{delta['removed']} removed, {delta['unchanged']} unchanged "
+            f"(see {os.path.join(OUTPUT_DIR, DEPLOY_MANIFEST_FILENAME)})"
+        )
+        
+        save_build_manifest(manifest)
+        logger.info(f"Build completed successfully. Generated {built_pages} pages in {OUTPUT_DIR}")
+        
+        if _profiler is not None:
+            write_profile_report(profile, page_template, page_options, profile_dump, memory_limit, fragment_cache)
+
+
+def write_profile_report(report_path: str, page_template: PageTemplate, page_options: PageOptions,
+                         profile_dump: bool = False, memory_limit: Optional[int] = None,
+                         fragment_cache: Optional[str] = None):
+    """
+    Write the --profile report. With profile_dump, the slowest date of this
+    build is rebuilt once under cProfile, with the build's memory_limit and
+    fragment_cache, and its stats saved next to the report.
+    """
+    global _profiler
+    report = _profiler.report()
+    report['options'] = asdict(page_options)
+    
+    page_times = {date: stages['page']['wall'] for date, stages in report['dates'].items() if 'page' in stages}
+    report['slowest_date'] = max(page_times, key=page_times.get) if page_times else None
+    report['cprofile'] = None
+    
+    if profile_dump and report['slowest_date']:
+        dump_path = f"{os.path.splitext(report_path)[0]}-{report['slowest_date']}.prof"
+        profiler, _profiler = _profiler, None
+        fragments = FragmentCache(fragment_cache) if fragment_cache else None
+        try:
+            cprofile = cProfile.Profile()
+            cprofile.runcall(build_date_page, report['slowest_date'], page_template, page_options,
+                             memory_limit=memory_limit, fragment_cache=fragments)
+            cprofile.dump_stats(dump_path)
+        finally:
+            _profiler = profiler
+            if fragments is not None:
+                fragments.close()
+        report['cprofile'] = dump_path
+        logger.info(f"Wrote cProfile stats for {report['slowest_date']} to {dump_path}")
+    
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Wrote build profile to {report_path}")
+
+
+class DatabaseWatcher:
+    """
+    Cheap change detection for --watch. PRAGMA data_version on a long-lived
+    connection changes whenever another connection commits; the database
+    and WAL file signatures additionally catch the file being replaced, and
+    the template signatures catch template edits.
+    """
+    
+    def __init__(self, database_path: str, template_paths: List[str], memory_limit: Optional[int] = None):
+        self.database_path = database_path
+        self.template_paths = template_paths
+        self.memory_limit = memory_limit
+        self.conn = None
+        self.data_version = None
+        self.signature = None
+        self.reopen()
+    
+    def get_signature(self) -> tuple:
+        signature = []
+        for path in [self.database_path, f"{self.database_path}-wal"] + self.template_paths:
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def reopen(self):
+        self.close()
+        self.conn = get_readonly_db_connection(memory_limit=self.memory_limit)
+        self.data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        self.signature = self.get_signature()
+    
+    def has_changed(self) -> bool:
+        """Whether anything changed since the previous call."""
+        signature = self.get_signature()
+        if signature[0] != self.signature[0]:
+            # Database file replaced or removed: the open connection is stale
+            if signature[0] is None:
+                self.signature = signature
+                return False
+            self.reopen()
+            return True
+        
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        changed = data_version != self.data_version or signature != self.signature
+        self.data_version = data_version
+        self.signature = signature
+        return changed
+    
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def watch_static_site(poll_interval: float = WATCH_POLL_INTERVAL, debounce: float = WATCH_DEBOUNCE,
+                      **build_options):
+    """
+    Build once, then keep rebuilding whenever the database or templates
+    change. Each rebuild is a normal incremental build, so only dates whose
+    content changed (plus index.html) are regenerated; compiled templates
+    are reused between builds. Bursts of writes are debounced so a rebuild
+    starts once the database has been quiet for `debounce` seconds.
+    The date index is checked once, every rebuild reads through the
+    watcher's connection, and commits that leave every date's
+    get_date_markers() marker and the templates unchanged skip the rebuild.
+    """
+    ensure_date_index(create=build_options.get('create_index', False))
+    build_options['check_date_index'] = False
+    watcher = DatabaseWatcher(DATABASE_PATH, [TEMPLATE_PATH, LANDING_PAGE_PATH], build_options.get('memory_limit'))
+    
+    def rebuild() -> bool:
+        try:
+            build_static_site(conn=watcher.conn, **build_options)
+            return True
+        except Exception as e:
+            # Keep watching; the next change is compared with the last good build
+            logger.error(f"Rebuild failed: {e}")
+            return False
+    
+    def read_markers() -> Optional[Dict[str, List[Any]]]:
+        try:
+            return get_date_markers(conn=watcher.conn)
+        except Exception as e:
+            logger.error(f"Could not read date markers: {e}")
+            return None
+    
+    # Markers are read before each build, so writes during it trigger another,
+    # and are only kept once that build succeeded, so failed builds are retried
+    markers = read_markers()
+    template_signature = watcher.signature[2:]
+    built_markers, built_templates = (markers, template_signature) if rebuild() else (None, None)
+    build_options['force'] = False  # --force only applies to the first build
+    
+    logger.info(f"Watching {DATABASE_PATH} for changes (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(poll_interval)
+            if not watcher.has_changed():
                 continue
             
-            # Generate HTML page
-            html_content = generate_static_page(date, paper_data, template_content)
+            # Wait for the writer to go quiet before rebuilding
+            first_change = last_change = time.monotonic()
+            while time.monotonic() - last_change < debounce and time.monotonic() - first_change < WATCH_MAX_DELAY:
+                time.sleep(poll_interval)
+                if watcher.has_changed():
+                    last_change = time.monotonic()
             
-            # Write to file
-            output_file = os.path.join(OUTPUT_DIR, f"{date}.html")
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            markers = read_markers()
+            template_signature = watcher.signature[2:]
+            templates_changed = template_signature != built_templates
+            if markers is None or built_markers is None:
+                logger.info("Changes detected, rebuilding")
+            else:
+                affected = sorted(
+                    date for date in set(markers) | set(built_markers)
+                    if markers.get(date) != built_markers.get(date)
+                )
+                if not affected and not templates_changed:
+                    logger.info("No date or template changed, skipping rebuild")
+                    continue
+                logger.info(
+                    f"Changes detected in {len(affected)} dates"
+                    f"{' and templates' if templates_changed else ''}, rebuilding"
+                )
+                logger.debug(f"Changed dates: {affected}")
             
-            logger.info(f"Generated {output_file} with {paper_data['total_papers']} papers")
-            built_pages += 1
+            started = time.perf_counter()
+            if rebuild():
+                built_markers, built_templates = markers, template_signature
+                logger.info(f"Rebuild finished in {time.perf_counter() - started:.2f}s")
             
-        except Exception as e:
-            logger.error(f"Failed to build page for {date}: {e}")
-            raise Exception(f"Build failed for {date}: {e}")
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
+    finally:
+        watcher.close()
+
+
+class PageCache:
+    """LRU of rendered pages bounded by the total size of their bodies."""
     
-    # Generate landing page (only if building all dates or no specific date was requested)
-    if not target_date:
-        try:
-            logger.info("Generating landing page")
-            landing_data = get_landing_page_data()
-            landing_html = generate_landing_page(landing_data, landing_template_content)
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (etag, body)
+        self.size = 0
+    
+    def get(self, key: tuple) -> Optional[tuple]:
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+    
+    def put(self, key: tuple, etag: str, body: bytes):
+        if key in self.entries:
+            self.size -= len(self.entries.pop(key)[1])
+        self.entries[key] = (etag, body)
+        self.size += len(body)
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+
+class PageRenderer:
+    """
+    Renders date pages and index.html on demand for --serve. Pages are
+    cached by (filename, data fingerprint, template hash), and fingerprints
+    are memoised until the database or a template changes, so repeat
+    requests cost a PRAGMA and a dictionary lookup. A date page's fingerprint
+    hashes that date's rows; index.html's hashes the grouped landing stats
+    it is rendered from.
+    """
+    
+    def __init__(self, options: PageOptions, cache_bytes: int):
+        self.options = options
+        self.cache = PageCache(cache_bytes)
+        self.watcher = DatabaseWatcher(DATABASE_PATH, [TEMPLATE_PATH, LANDING_PAGE_PATH])
+        self.conn = get_readonly_db_connection()
+        self.fingerprints = {}  # filename -> data fingerprint, or None for unknown dates
+        self.landing_data = None
+    
+    def refresh(self):
+        """Forget fingerprints (and reconnect) once anything changed on disk."""
+        if self.watcher.has_changed():
+            logger.info("Database or templates changed, revalidating cached pages")
+            self.fingerprints.clear()
+            self.landing_data = None
+            self.conn.close()
+            self.conn = get_readonly_db_connection()
+    
+    def get_fingerprint(self, filename: str) -> Optional[str]:
+        if filename not in self.fingerprints:
+            match = DATE_PAGE_PATTERN.match(filename)
+            if filename == 'index.html':
+                self.landing_data = get_landing_page_data(self.conn)
+                fingerprint = hash_text(json.dumps(self.landing_data, sort_keys=True))
+            elif match:
+                date_fingerprint = get_date_fingerprints(match.group(1), self.conn).get(match.group(1))
+                fingerprint = date_fingerprint['content'] if date_fingerprint else None
+            else:
+                fingerprint = None
+            self.fingerprints[filename] = fingerprint
+        return self.fingerprints[filename]
+    
+    def render(self, filename: str) -> Optional[tuple]:
+        """Return (etag, body) for a page, or None if there is no such page."""
+        self.refresh()
+        fingerprint = self.get_fingerprint(filename)
+        if fingerprint is None:
+            return None
+        
+        if filename == 'index.html':
+            template = load_template(LANDING_PAGE_PATH, LANDING_TEMPLATE_SLOTS)
+        else:
+            template = load_template(TEMPLATE_PATH, PAGE_TEMPLATE_SLOTS)
+        key = (filename, fingerprint, template.content_hash)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        started = time.perf_counter()
+        if filename == 'index.html':
+            html = generate_landing_page(self.landing_data, template)
+        else:
+            date = filename[:-len('.html')]
+            html = generate_static_page(date, get_page_data(date, self.options, self.conn), template, self.options)
+        body = html.encode('utf-8')
+        etag = f'"{hash_text(json.dumps([key, asdict(self.options)]))[:32]}"'
+        self.cache.put(key, etag, body)
+        logger.info(f"Rendered {filename} in {(time.perf_counter() - started) * 1000:.0f}ms ({len(body)} bytes)")
+        return etag, body
+
+
+def serve_static_site(options: PageOptions, host: str = SERVE_HOST, port: int = SERVE_PORT,
+                      cache_mb: int = SERVE_CACHE_MB):
+    """
+    Serve pages rendered on request from the database for template work.
+    Date pages and index.html are rendered (and cached) on demand; any
+    other path is served from OUTPUT_DIR if a previous build left it there.
+    """
+    renderer = PageRenderer(options, cache_mb * 1024 * 1024)
+    output_root = os.path.abspath(OUTPUT_DIR)
+    
+    class RenderRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.respond(send_body=True)
+        
+        def do_HEAD(self):
+            self.respond(send_body=False)
+        
+        def respond(self, send_body: bool):
+            filename = unquote(urlsplit(self.path).path).lstrip('/') or 'index.html'
+            try:
+                page = renderer.render(filename) if filename == 'index.html' or DATE_PAGE_PATTERN.match(filename) else None
+            except Exception as e:
+                logger.error(f"Failed to render {filename}: {e}")
+                self.send_error(500, str(e))
+                return
             
-            # Write landing page to output directory
-            landing_output_file = os.path.join(OUTPUT_DIR, "index.html")
-            with open(landing_output_file, 'w', encoding='utf-8') as f:
-                f.write(landing_html)
+            if page is not None:
+                etag, body = page
+                if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_body(body, 'text/html; charset=utf-8', send_body, etag)
+                return
             
-            logger.info(f"Generated {landing_output_file} with {len(landing_data)} date entries")
+            # Fall back to files from a previous build (assets, shards, indexes)
+            path = os.path.abspath(os.path.join(output_root, filename))
+            if path.startswith(output_root + os.sep) and os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    body = f.read()
+                self.send_body(body, mimetypes.guess_type(path)[0] or 'application/octet-stream', send_body)
+                return
             
-        except Exception as e:
-            logger.error(f"Failed to build landing page: {e}")
-            raise Exception(f"Landing page build failed: {e}")
+            self.send_error(404, f"No page for {filename}")
+        
+        def send_body(self, body: bytes, content_type: str, send_body: bool, etag: Optional[str] = None):
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-cache')
+            if etag:
+                self.send_header('ETag', etag)
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} - {format % args}")
     
-    logger.info(f"Build completed successfully. Generated {built_pages} pages in {OUTPUT_DIR}")
+    # Single-threaded on purpose: the renderer and its connections are not shared across threads
+    server = HTTPServer((host, port), RenderRequestHandler)
+    logger.info(f"Serving rendered pages on http://{host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopped server")
+    finally:
+        server.server_close()
+        renderer.watcher.close()
+        renderer.conn.close()
 
 
 def main():
@@ -551,6 +3057,140 @@ def main():
         type=int, 
         help='Maximum number of papers per date (for testing)'
     )
+    parser.add_argument(
+        '--create-index',
+        action='store_true',
+        help='Create an index on DATE(published_date) in the database if missing'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild all pages even if their inputs are unchanged'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Number of parallel worker processes for building date pages'
+    )
+    parser.add_argument(
+        '--external-assets',
+        action='store_true',
+        help='Move inline CSS/JS from the templates into content-hashed files under assets/'
+    )
+    parser.add_argument(
+        '--compact-payload',
+        action='store_true',
+        help='Embed paper data as minified, dictionary-encoded columns instead of indented JSON'
+    )
+    parser.add_argument(
+        '--precompress',
+        action='store_true',
+        help='Write .gz (and .br if brotli is installed) sidecars next to changed outputs'
+    )
+    parser.add_argument(
+        '--split-details',
+        action='store_true',
+        help='Embed only filter/sort fields in pages and write text-heavy fields to '
+             'shards under data/ that are fetched per page (requires serving over HTTP)'
+    )
+    parser.add_argument(
+        '--detail-shard-size',
+        type=int,
+        default=DEFAULT_DETAIL_SHARD_SIZE,
+        help=f'Papers per detail shard with --split-details (default: {DEFAULT_DETAIL_SHARD_SIZE})'
+    )
+    parser.add_argument(
+        '--client-indexes',
+        action='store_true',
+        help='Embed precomputed sort orders and filter facets so pages skip client-side sorting'
+    )
+    parser.add_argument(
+        '--search-index',
+        action='store_true',
+        help='Maintain a static cross-date search index under search/ for the landing page'
+    )
+    parser.add_argument(
+        '--author-index',
+        action='store_true',
+        help='Build a cross-date author index under authors/ and link authors to it from pages'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='build-profile.json',
+        metavar='REPORT',
+        help='Write per-stage and per-date timings, sizes and peak memory to a JSON report '
+             '(default: build-profile.json)'
+    )
+    parser.add_argument(
+        '--profile-dump',
+        action='store_true',
+        help='With --profile, also save cProfile stats for the slowest date'
+    )
+    parser.add_argument(
+        '--memory-limit',
+        type=int,
+        metavar='MB',
+        help='Stream date pages paper by paper, keeping about MB of paper data in memory'
+    )
+    parser.add_argument(
+        '--landing-dates',
+        type=int,
+        metavar='N',
+        help='Embed only the N newest dates in index.html and load older months from archive/ on scroll'
+    )
+    parser.add_argument(
+        '--immutable-db',
+        action='store_true',
+        help='Open the database as an immutable snapshot (no locking; nothing may write to it during the build)'
+    )
+    parser.add_argument(
+        '--fragment-cache',
+        nargs='?',
+        const=FRAGMENT_CACHE_PATH,
+        metavar='PATH',
+        help=f'Reuse each paper\'s serialized JSON across builds, stored in PATH (default: {FRAGMENT_CACHE_PATH})'
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run a local server that renders pages from the database on request'
+    )
+    parser.add_argument(
+        '--host',
+        default=SERVE_HOST,
+        help=f'Address for --serve to listen on (default: {SERVE_HOST})'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=SERVE_PORT,
+        help=f'Port for --serve to listen on (default: {SERVE_PORT})'
+    )
+    parser.add_argument(
+        '--serve-cache-mb',
+        type=int,
+        default=SERVE_CACHE_MB,
+        help=f'Memory for rendered pages kept by --serve, in MB (default: {SERVE_CACHE_MB})'
+    )
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and rebuild changed dates whenever the database or templates change'
+    )
+    parser.add_argument(
+        '--watch-interval',
+        type=float,
+        default=WATCH_POLL_INTERVAL,
+        help=f'Seconds between change checks in --watch mode (default: {WATCH_POLL_INTERVAL})'
+    )
+    parser.add_argument(
+        '--watch-debounce',
+        type=float,
+        default=WATCH_DEBOUNCE,
+        help=f'Seconds the database must stay unchanged before a rebuild (default: {WATCH_DEBOUNCE})'
+    )
     
     args = parser.parse_args()
     
@@ -568,10 +3208,94 @@ def main():
             logger.error(f"max-papers must be positive integer, got: {args.max_papers}")
             return 1
         
-        # Run the build
-        build_static_site(
+        # Validate jobs
+        if args.jobs <= 0:
+            logger.error(f"jobs must be positive integer, got: {args.jobs}")
+            return 1
+        
+        # Validate detail shard size
+        if args.detail_shard_size <= 0:
+            logger.error(f"detail-shard-size must be positive integer, got: {args.detail_shard_size}")
+            return 1
+        
+        # Validate profiling options
+        if args.profile_dump and not args.profile:
+            logger.error("--profile-dump requires --profile")
+            return 1
+        
+        # Validate streaming options
+        if args.memory_limit is not None and args.memory_limit <= 0:
+            logger.error(f"memory-limit must be positive integer, got: {args.memory_limit}")
+            return 1
+        if (args.memory_limit is not None or args.fragment_cache) and (
+                args.compact_payload or args.split_details or args.client_indexes):
+            logger.error(
+                "--memory-limit and --fragment-cache stream the default payload; "
+                "drop --compact-payload/--split-details/--client-indexes"
+            )
+            return 1
+        
+        # Validate landing page size
+        if args.landing_dates is not None and args.landing_dates <= 0:
+            logger.error(f"landing-dates must be positive integer, got: {args.landing_dates}")
+            return 1
+        
+        # An immutable snapshot cannot notice the writes that watch/serve react to
+        if args.immutable_db and (args.watch or args.serve):
+            logger.error("--immutable-db cannot be combined with --watch or --serve")
+            return 1
+        
+        # Validate watch timings
+        if args.watch_interval <= 0 or args.watch_debounce < 0:
+            logger.error("watch-interval must be positive and watch-debounce non-negative")
+            return 1
+        
+        # Render pages on request instead of building
+        if args.serve:
+            if args.split_details or args.external_assets:
+                logger.error("--serve renders self-contained pages; drop --split-details/--external-assets")
+                return 1
+            if args.serve_cache_mb <= 0:
+                logger.error(f"serve-cache-mb must be positive integer, got: {args.serve_cache_mb}")
+                return 1
+            ensure_date_index(create=args.create_index)
+            serve_static_site(
+                PageOptions(
+                    max_papers=args.max_papers,
+                    compact_payload=args.compact_payload,
+                    client_indexes=args.client_indexes,
+                    author_index=args.author_index
+                ),
+                host=args.host,
+                port=args.port,
+                cache_mb=args.serve_cache_mb
+            )
+            return 0
+        
+        # Run the build, or keep rebuilding on changes with --watch
+        build = build_static_site
+        if args.watch:
+            build = lambda **options: watch_static_site(args.watch_interval, args.watch_debounce, **options)
+        build(
             target_date=args.date,
-            max_papers=args.max_papers
+            max_papers=args.max_papers,
+            create_index=args.create_index,
+            force=args.force,
+            jobs=args.jobs,
+            external_assets=args.external_assets,
+            compact_payload=args.compact_payload,
+            precompress=args.precompress,
+            split_details=args.split_details,
+            detail_shard_size=args.detail_shard_size,
+            client_indexes=args.client_indexes,
+            search_index=args.search_index,
+            author_index=args.author_index,
+            profile=args.profile,
+            profile_dump=args.profile_dump,
+            memory_limit=args.memory_limit * 1024 * 1024 if args.memory_limit else None,
+            immutable_db=args.immutable_db,
+            landing_dates=args.landing_dates,
+            fragment_cache=args.fragment_cache
         )
         
         return 0
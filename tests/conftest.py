@@ -0,0 +1,46 @@
+"""Shared fixtures for the builder tests."""
+
+import os
+import sqlite3
+import sys
+from typing import Any, Dict, Iterable
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import builder  # noqa: E402
+
+REAL_COLUMNS = {
+    'rlhf_score', 'weak_supervision_score', 'diffusion_reasoning_score',
+    'distributed_training_score', 'datasets_score', 'average_h_index',
+}
+INTEGER_COLUMNS = {'total_authors', 'authors_found', 'highest_h_index', 'notable_authors_count'}
+
+
+def create_papers_db(rows: Iterable[Dict[str, Any]]) -> sqlite3.Connection:
+    """Create an in-memory database with the scraper's papers schema holding rows."""
+    conn = sqlite3.connect(':memory:')
+    conn.row_factory = sqlite3.Row
+    columns = []
+    for column in builder.PAPER_COLUMNS:
+        column_type = 'REAL' if column in REAL_COLUMNS else 'INTEGER' if column in INTEGER_COLUMNS else 'TEXT'
+        columns.append(f"{column} {column_type}" + (" PRIMARY KEY" if column == 'id' else ""))
+    conn.execute(f"CREATE TABLE papers ({', '.join(columns)}, created_at TEXT, updated_at TEXT)")
+    for row in rows:
+        names = list(row)
+        conn.execute(
+            f"INSERT INTO papers ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+            [row[name] for name in names]
+        )
+    conn.commit()
+    return conn
+
+
+@pytest.fixture
+def use_connection(monkeypatch):
+    """Route builder reads through the given connection, as a build does."""
+    def install(conn: sqlite3.Connection) -> sqlite3.Connection:
+        monkeypatch.setattr(builder, '_shared_conn', conn)
+        return conn
+    return install
@@ -0,0 +1,50 @@
+"""Cached date fingerprints must match a full re-hash after database edits."""
+
+import builder
+from conftest import create_papers_db
+
+
+def make_paper(paper_id: int, published_date: str, updated_at: str = '2025-07-25 00:00:00'):
+    return {'id': f'2507.{paper_id:05d}', 'title': f'Paper {paper_id}',
+            'published_date': published_date, 'updated_at': updated_at}
+
+
+def test_cached_fingerprints_follow_edits(use_connection):
+    conn = use_connection(create_papers_db(
+        [make_paper(i, f'2025-07-{9 + i % 3:02d}T10:00:00Z') for i in range(30)]
+    ))
+    cache = {}
+    assert builder.get_date_fingerprints(cache=cache) == builder.get_date_fingerprints()
+    assert sorted(cache) == ['2025-07-09', '2025-07-10', '2025-07-11']
+    untouched = dict(cache['2025-07-11'])
+
+    # An edit bumps updated_at, a delete lowers the count, a move changes two dates
+    conn.execute("UPDATE papers SET title = 'Edited', updated_at = '2025-07-26 00:00:00' WHERE id = '2507.00000'")
+    conn.execute("DELETE FROM papers WHERE id = '2507.00001'")
+    conn.execute("UPDATE papers SET published_date = '2025-07-12T10:00:00Z' WHERE id = '2507.00004'")
+    fingerprints = builder.get_date_fingerprints(cache=cache)
+
+    assert fingerprints == builder.get_date_fingerprints()
+    assert sorted(cache) == ['2025-07-09', '2025-07-10', '2025-07-11', '2025-07-12']
+    assert cache['2025-07-11'] == untouched
+
+
+def test_stale_dates_are_dropped_from_cache(use_connection):
+    conn = use_connection(create_papers_db([make_paper(1, '2025-07-09'), make_paper(2, '2025-07-10')]))
+    cache = {}
+    builder.get_date_fingerprints(cache=cache)
+    conn.execute("DELETE FROM papers WHERE id = '2507.00002'")
+
+    assert builder.get_date_fingerprints('2025-07-09', cache=cache) == builder.get_date_fingerprints('2025-07-09')
+    assert sorted(cache) == ['2025-07-09', '2025-07-10']
+    assert builder.get_date_fingerprints(cache=cache) == builder.get_date_fingerprints()
+    assert sorted(cache) == ['2025-07-09']
+
+
+def test_without_updated_at_every_date_is_hashed(use_connection):
+    conn = use_connection(create_papers_db([make_paper(1, '2025-07-09')]))
+    conn.execute("ALTER TABLE papers DROP COLUMN updated_at")
+    cache = {}
+
+    assert builder.get_date_fingerprints(cache=cache) == builder.get_date_fingerprints()
+    assert cache == {}
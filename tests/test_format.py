@@ -0,0 +1,81 @@
+"""format_paper_rows() must produce byte-identical JSON to format_paper_data()."""
+
+import json
+
+import builder
+from conftest import create_papers_db
+
+EDGE_CASES = [
+    # Odd published_date strings
+    {'published_date': '2025-07-09'},
+    {'published_date': '2025-07-09T23:59:59+05:00'},
+    {'published_date': '2025-07-09 12:00:00'},
+    {'published_date': '2025-02-30T00:00:00Z'},
+    {'published_date': '2025-07-09T24:00:00'},
+    {'published_date': '0999-01-01T00:00:00'},
+    {'published_date': 'July 9 2025'},
+    {'published_date': 'x2025-07-09'},
+    {'published_date': '20250709'},
+    {'published_date': '2025-7-9'},
+    {'published_date': ''},
+    {'published_date': None},
+    # NULL, textual and integer scores and counts
+    {'rlhf_score': None, 'datasets_score': None, 'average_h_index': None,
+     'total_authors': None, 'authors_found': None, 'highest_h_index': None, 'notable_authors_count': None},
+    {'rlhf_score': '0.25', 'weak_supervision_score': 1, 'highest_h_index': 3.0, 'average_h_index': 7},
+    # Malformed, empty and non-list JSON fields
+    {'authors': 'not json', 'categories': None, 'author_h_indexes': ''},
+    {'authors': '{"a": 1}', 'categories': '{"cs.LG": true}', 'author_h_indexes': '{"name": "X"}'},
+    {'authors': None, 'author_h_indexes': None},
+    {'author_h_indexes': '[]'},
+    {'author_h_indexes': '[ ]'},
+    {'author_h_indexes': '[1, {"name": "X"}, "s", {"h_index": 4, "profile_url": null}]'},
+    # NULL text fields and math detection
+    {'title': '$x$', 'abstract': None, 'summary': 'costs \\(O(n)\\)', 'rlhf_justification': 'US$5 only'},
+    {'title': 'Café — “quotes” </script>', 'abstract': '\\begin{equation}a\\end{equation}'},
+]
+
+
+def make_row(index, overrides):
+    row = {
+        'id': f'2507.{index:05d}',
+        'title': f'Paper {index}',
+        'authors': json.dumps(['Ada Lovelace', 'Alan Turing']),
+        'categories': json.dumps(['cs.LG (Machine Learning)']),
+        'abstract': 'An abstract.',
+        'summary': 'A summary.',
+        'published_date': '2025-07-09T10:00:00Z',
+        'rlhf_score': 0.5,
+        'weak_supervision_score': 0.0,
+        'diffusion_reasoning_score': 0.1,
+        'distributed_training_score': 0.2,
+        'datasets_score': 0.3,
+        'recommendation_score': 'Must Read',
+        'total_authors': 2,
+        'authors_found': 1,
+        'highest_h_index': 40,
+        'average_h_index': 20.5,
+        'notable_authors_count': 1,
+        'author_h_indexes': json.dumps([
+            {'name': 'Ada Lovelace', 'h_index': 40, 'profile_url': 'https://example.org/ada'},
+            {'name': 'Alan Turing'}
+        ]),
+    }
+    row.update(overrides)
+    return row
+
+
+def test_batch_formatting_matches_row_formatting():
+    conn = create_papers_db(make_row(index, overrides) for index, overrides in enumerate(EDGE_CASES))
+
+    rows = conn.execute(f"SELECT {', '.join(builder.PAPER_COLUMNS)} FROM papers ORDER BY id").fetchall()
+    expected = [builder.format_paper_data(row) for row in rows]
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    tuples = cursor.execute(f"SELECT {builder.FORMAT_SELECT_SQL} FROM papers ORDER BY id").fetchall()
+    papers = builder.format_paper_rows(tuples)
+
+    assert len(papers) == len(EDGE_CASES)
+    for paper, expected_paper in zip(papers, expected):
+        assert json.dumps(paper, ensure_ascii=False, indent=2) == json.dumps(expected_paper, ensure_ascii=False, indent=2)
+    assert builder.safe_json_dumps({'papers': papers}) == builder.safe_json_dumps({'papers': expected})
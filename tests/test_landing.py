@@ -0,0 +1,119 @@
+"""The grouped landing page query must match the original per-date queries."""
+
+import random
+import sqlite3
+from typing import Any, Dict, List
+
+import builder
+from conftest import create_papers_db
+
+RELEVANT = ('Highly Relevant', 'Moderately Relevant', 'Tangentially Relevant')
+TOPICS = [
+    ('RLHF', 'rlhf_relevance'),
+    ('Weak Supervision', 'weak_supervision_relevance'),
+    ('Diffusion Reasoning', 'diffusion_reasoning_relevance'),
+    ('Distributed Training', 'distributed_training_relevance'),
+    ('Datasets', 'datasets_relevance'),
+]
+
+
+def legacy_landing_page_data(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """The original implementation: a distinct-dates query, then three queries per date."""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT DISTINCT DATE(published_date) as date
+        FROM papers
+        WHERE published_date IS NOT NULL
+        ORDER BY date DESC
+    """)
+    dates = [row['date'] for row in cursor.fetchall()]
+
+    landing_data = []
+    for date in dates:
+        cursor.execute("SELECT COUNT(*) as total FROM papers WHERE DATE(published_date) = ?", (date,))
+        total_papers = cursor.fetchone()['total']
+        if total_papers == 0:
+            continue
+
+        cursor.execute("""
+            SELECT
+                COUNT(CASE WHEN recommendation_score = 'Must Read' THEN 1 END) as must_read,
+                COUNT(CASE WHEN recommendation_score = 'Should Read' THEN 1 END) as should_read
+            FROM papers
+            WHERE DATE(published_date) = ?
+        """, (date,))
+        rec_stats = cursor.fetchone()
+
+        placeholders = ', '.join('?' * len(RELEVANT))
+        cursor.execute(f"""
+            SELECT
+                {', '.join(f"COUNT(CASE WHEN {column} IN ({placeholders}) THEN 1 END)" for _, column in TOPICS)}
+            FROM papers
+            WHERE DATE(published_date) = ?
+        """, RELEVANT * len(TOPICS) + (date,))
+        relevance_stats = cursor.fetchone()
+
+        stats = {"Must Read": rec_stats['must_read'], "Should Read": rec_stats['should_read']}
+        for index, (label, _) in enumerate(TOPICS):
+            stats[label] = relevance_stats[index]
+        landing_data.append({
+            "date": builder.format_date_for_title(date),
+            "day": builder.get_day_name(date),
+            "stats": stats,
+            "total": total_papers,
+            "url": f"{date}.html"
+        })
+    return landing_data
+
+
+def make_paper(paper_id: int, published_date: Any, recommendation: Any = None,
+               relevance: Any = None) -> Dict[str, Any]:
+    paper = {'id': f'2507.{paper_id:05d}', 'published_date': published_date,
+             'recommendation_score': recommendation}
+    for _, column in TOPICS:
+        paper[column] = relevance
+    return paper
+
+
+def test_edge_case_dates_match_legacy_queries(use_connection):
+    conn = use_connection(create_papers_db([
+        make_paper(1, '2025-07-09T10:00:00Z', 'Must Read', 'Highly Relevant'),
+        make_paper(2, '2025-07-09 23:59:59', 'Should Read', 'Not Relevant'),
+        make_paper(3, '2025-07-09', None, 'Tangentially Relevant'),
+        # Offsets are normalised to UTC by DATE(), moving these across days
+        make_paper(4, '2025-07-09T22:00:00-05:00', 'Must Read', 'Moderately Relevant'),
+        make_paper(5, '2025-07-10T01:00:00+03:00', 'Can Skip', None),
+        make_paper(6, '2025-07-10T12:00:00.123+00:00', 'Should Read', 'Highly Relevant'),
+        # NULL, empty and unparseable dates never reach the landing page
+        make_paper(7, None, 'Must Read', 'Highly Relevant'),
+        make_paper(8, '', 'Must Read', 'Highly Relevant'),
+        make_paper(9, 'not a date', 'Must Read', 'Highly Relevant'),
+        make_paper(10, '09/07/2025', 'Should Read', 'Highly Relevant'),
+        make_paper(11, '2025-13-45T00:00:00Z', 'Must Read', None),
+    ]))
+
+    landing_data = builder.get_landing_page_data()
+
+    assert landing_data == legacy_landing_page_data(conn)
+    assert [entry['url'] for entry in landing_data] == ['2025-07-10.html', '2025-07-09.html']
+    assert [entry['total'] for entry in landing_data] == [2, 4]
+
+
+def test_random_papers_match_legacy_queries(use_connection):
+    rng = random.Random(7)
+    date_values = [
+        None, '', 'garbage', '2025-02-30',
+        '2025-07-01T08:00:00Z', '2025-07-01T23:30:00-02:00', '2025-07-02',
+        '2025-07-02T00:15:00+01:00', '2025-07-03 12:00:00', '2024-12-31T23:59:59Z',
+    ]
+    recommendations = [None, 'Must Read', 'Should Read', 'Can Skip', 'Ignore', '']
+    relevances = [None, 'Not Relevant', ''] + list(RELEVANT)
+    rows = []
+    for paper_id in range(400):
+        paper = make_paper(paper_id, rng.choice(date_values), rng.choice(recommendations))
+        for _, column in TOPICS:
+            paper[column] = rng.choice(relevances)
+        rows.append(paper)
+    conn = use_connection(create_papers_db(rows))
+
+    assert builder.get_landing_page_data() == legacy_landing_page_data(conn)
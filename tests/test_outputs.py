@@ -0,0 +1,20 @@
+"""Outputs of dates that left the database are deleted before the deploy delta."""
+
+import builder
+
+
+def test_stale_date_outputs_are_removed(tmp_path, monkeypatch):
+    monkeypatch.setattr(builder, 'OUTPUT_DIR', str(tmp_path))
+    for filename in ['2025-07-09.html', '2025-07-09.html.gz', '2025-07-09.html.br',
+                     '2025-07-10.html', '2025-07-10.html.gz', 'index.html', 'notes-2025-07-09.html']:
+        (tmp_path / filename).write_text('x')
+    for date in ['2025-07-09', '2025-07-10']:
+        (tmp_path / 'data' / date).mkdir(parents=True)
+        (tmp_path / 'data' / date / 'details-0.json').write_text('[]')
+        (tmp_path / 'data' / date / 'details-0.json.gz').write_text('x')
+
+    assert builder.remove_stale_date_outputs({'2025-07-10'}) == 5
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        '2025-07-10.html', '2025-07-10.html.gz', 'data', 'index.html', 'notes-2025-07-09.html'
+    ]
+    assert [path.name for path in (tmp_path / 'data').iterdir()] == ['2025-07-10']
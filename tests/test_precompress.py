@@ -0,0 +1,25 @@
+"""Precompressed sidecars follow the outputs they were made from."""
+
+import os
+
+import builder
+
+
+def test_orphan_sidecars_are_removed(tmp_path, monkeypatch):
+    monkeypatch.setattr(builder, 'OUTPUT_DIR', str(tmp_path))
+    (tmp_path / 'data' / '2025-07-09').mkdir(parents=True)
+    (tmp_path / 'index.html').write_text('<html>index</html>')
+    (tmp_path / 'data' / '2025-07-09' / 'details-0.json').write_text('{"papers": []}')
+    manifest = {'compressed': {}}
+
+    builder.precompress_outputs(manifest)
+    assert sorted(manifest['compressed']) == ['data/2025-07-09/details-0.json', 'index.html']
+    assert (tmp_path / 'data' / '2025-07-09' / 'details-0.json.gz').exists()
+
+    os.remove(tmp_path / 'data' / '2025-07-09' / 'details-0.json')
+    (tmp_path / 'data' / '2025-07-09' / 'details-0.json.br').write_bytes(b'stale')
+    builder.precompress_outputs(manifest)
+
+    assert sorted(manifest['compressed']) == ['index.html']
+    assert os.listdir(tmp_path / 'data' / '2025-07-09') == []
+    assert (tmp_path / 'index.html.gz').exists()
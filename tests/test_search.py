@@ -0,0 +1,107 @@
+"""Long postings lists are split into continuation chunks without losing postings."""
+
+import json
+import random
+
+import builder
+from conftest import create_papers_db
+
+
+def decode(encoded):
+    doc = 0
+    pairs = []
+    for delta, weight in zip(encoded[0::2], encoded[1::2]):
+        doc += delta
+        pairs.append((doc, weight))
+    return pairs
+
+
+def test_split_postings_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(builder, 'OUTPUT_DIR', str(tmp_path))
+    monkeypatch.setattr(builder, 'SEARCH_CHUNK_POSTINGS', 8)
+    monkeypatch.setattr(builder, 'SEARCH_TOP_POSTINGS', 5)
+    (tmp_path / builder.SEARCH_DIRNAME).mkdir()
+    rng = random.Random(3)
+    state = {'next_chunk': 0}
+    pairs = []
+    entry = []
+
+    # Append postings in increasing doc order over several builds
+    for _ in range(4):
+        batch = [(doc, rng.randint(1, 9)) for doc in range(len(pairs) * 2, len(pairs) * 2 + 2 * rng.randint(3, 13), 2)]
+        postings = entry['postings'] if isinstance(entry, dict) else entry
+        last_doc = sum(postings[0::2])
+        for doc, weight in batch:
+            postings.extend((doc - last_doc, weight))
+            last_doc = doc
+        pairs.extend(batch)
+        entry = builder.split_search_postings(entry, state)
+
+    chunked = []
+    for chunk_id, first_doc, last_doc, count, max_weight in entry['chunks']:
+        chunk = decode(json.loads((tmp_path / builder.SEARCH_DIRNAME / f'chunks-{chunk_id}.json').read_text()))
+        assert len(chunk) == count == 8
+        assert (chunk[0][0], chunk[-1][0] + 1) == (first_doc, last_doc)
+        assert max(weight for _, weight in chunk) == max_weight
+        chunked.extend(chunk)
+
+    assert len(entry['postings']) < 2 * 8
+    assert chunked + decode(entry['postings']) == pairs
+    best = sorted(chunked, key=lambda pair: (-pair[1], -pair[0]))[:5]
+    assert list(zip(entry['top'][0::2], entry['top'][1::2])) == best
+
+
+def test_short_postings_stay_inline(tmp_path, monkeypatch):
+    monkeypatch.setattr(builder, 'OUTPUT_DIR', str(tmp_path))
+    state = {'next_chunk': 0}
+    entry = builder.encode_search_postings([(1, 4), (5, 1)])
+
+    assert builder.split_search_postings(entry, state) == [1, 4, 4, 1]
+    assert state['next_chunk'] == 0
+
+
+def make_papers(count, dates):
+    return [
+        {'id': f'2507.{index:05d}', 'title': f'Paper {index} on preference learning',
+         'authors': json.dumps([f'Author {index % 7}']), 'abstract': 'Robust feedback models.',
+         'summary': None, 'published_date': f'{dates[index % len(dates)]}T10:00:00Z',
+         'updated_at': '2025-07-25 00:00:00'}
+        for index in range(count)
+    ]
+
+
+def read_search_index(tmp_path):
+    return json.loads((tmp_path / builder.SEARCH_DIRNAME / 'index.json').read_text())
+
+
+def count_live_docs(index):
+    return index['doc_count'] - sum(last - first for first, last in index['deleted'])
+
+
+def test_single_date_builds_keep_other_dates(tmp_path, monkeypatch, use_connection):
+    monkeypatch.setattr(builder, 'OUTPUT_DIR', str(tmp_path))
+    dates = ['2025-07-09', '2025-07-10', '2025-07-11', '2025-07-12']
+    conn = use_connection(create_papers_db(make_papers(40, dates)))
+    manifest = {}
+    builder.update_search_index(manifest, builder.get_date_fingerprints(), full_build=True)
+    assert read_search_index(tmp_path)['doc_count'] == 40
+
+    # A forced single-date build re-indexes only that date
+    builder.update_search_index(manifest, builder.get_date_fingerprints('2025-07-10'), full_build=False, force=True)
+    index = read_search_index(tmp_path)
+    assert count_live_docs(index) == 40
+    assert index['deleted'] == [[10, 20]]
+    assert sorted(manifest['search']['dates']) == dates
+
+    # Enough replaced documents to need a rebuild still keep every date
+    for title in ['Edited', 'Edited again', 'Edited once more']:
+        conn.execute("UPDATE papers SET title = ? WHERE published_date LIKE '2025-07-11%'", (title,))
+        builder.update_search_index(manifest, builder.get_date_fingerprints('2025-07-11'), full_build=False)
+    assert sorted(manifest['search']['dates']) == dates
+    assert count_live_docs(read_search_index(tmp_path)) == 40
+
+    # The next full build performs the deferred rebuild
+    builder.update_search_index(manifest, builder.get_date_fingerprints(), full_build=True)
+    index = read_search_index(tmp_path)
+    assert (index['doc_count'], index['deleted']) == (40, [])
+    assert sorted(manifest['search']['dates']) == dates